@@ -26,18 +26,64 @@ Usage:
 """
 
 import base64
+import functools
 import json
-import keyring
 import requests
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any
-from urllib.parse import urlparse
+from typing import Optional, Dict
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import os
+import stat
+import threading
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+_HTTP_PREFIXES = ('https://', 'http://')
+
+# OAuth2 token persistence: keyring service name and in-process LRU
+_KEYRING_SERVICE = 'scrape-api-docs-oauth2'
+_TOKEN_CACHE_SIZE = 128
+_token_cache: Dict[str, dict] = {}
+_token_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_netloc(url: str) -> str:
+    """Extract netloc via full URL parsing (memoized)."""
+    return urlsplit(url).netloc
+
+
+def _extract_domain(url: str) -> str:
+    """
+    Extract domain (netloc) from URL.
+
+    The common ``http(s)://host/...`` shape is handled by slicing the string
+    directly; anything else falls back to memoized urlsplit.
+    """
+    if url.startswith(_HTTP_PREFIXES):
+        start = url.find('://') + 3
+        end = len(url)
+        for sep in '/?#':
+            i = url.find(sep, start, end)
+            if i != -1:
+                end = i
+        return url[start:end]
+    return _split_netloc(url)
+
+
 class AuthType(Enum):
     """Supported authentication types."""
     NONE = 'none'
@@ -65,6 +111,14 @@ class Credential:
         self.auth_type = auth_type
         self.params = kwargs
 
+        # Build the Authorization header once instead of per session/request
+        self._auth_header: Optional[str] = None
+        if auth_type == AuthType.BASIC:
+            userpass = f"{kwargs.get('username')}:{kwargs.get('password')}"
+            self._auth_header = 'Basic ' + base64.b64encode(userpass.encode()).decode()
+        elif auth_type == AuthType.BEARER:
+            self._auth_header = f"Bearer {kwargs.get('token')}"
+
     def to_dict(self) -> dict:
         """Convert credential to dictionary."""
         return {
@@ -85,55 +139,77 @@ class Credential:
         Args:
             session: requests.Session to configure
         """
-        if self.auth_type == AuthType.BASIC:
-            username = self.params.get('username')
-            password = self.params.get('password')
-            session.auth = (username, password)
-            logger.debug(f"Applied Basic auth for user: {username}")
-
-        elif self.auth_type == AuthType.BEARER:
-            token = self.params.get('token')
-            session.headers['Authorization'] = f'Bearer {token}'
-            logger.debug("Applied Bearer token authentication")
-
-        elif self.auth_type == AuthType.API_KEY:
-            api_key = self.params.get('api_key')
-            key_name = self.params.get('key_name', 'X-API-Key')
-            location = self.params.get('location', 'header')
-
-            if location == 'header':
-                session.headers[key_name] = api_key
-                logger.debug(f"Applied API key to header: {key_name}")
-            elif location == 'query':
-                # Will be added per-request
-                session.params = {key_name: api_key}
-                logger.debug(f"Applied API key to query param: {key_name}")
-
-        elif self.auth_type == AuthType.COOKIE:
-            cookies = self.params.get('cookies', {})
-            for name, value in cookies.items():
-                session.cookies.set(name, value)
-            logger.debug(f"Applied {len(cookies)} cookies")
-
-        elif self.auth_type == AuthType.CUSTOM_HEADER:
-            headers = self.params.get('headers', {})
-            session.headers.update(headers)
-            logger.debug(f"Applied {len(headers)} custom headers")
+        handler = self._HANDLERS.get(self.auth_type)
+        if handler:
+            handler(self, session)
+
+    def _apply_basic(self, session: requests.Session):
+        """Apply HTTP Basic authentication."""
+        session.headers['Authorization'] = self._auth_header
+        logger.debug(f"Applied Basic auth for user: {self.params.get('username')}")
+
+    def _apply_bearer(self, session: requests.Session):
+        """Apply Bearer token authentication."""
+        session.headers['Authorization'] = self._auth_header
+        logger.debug("Applied Bearer token authentication")
+
+    def _apply_api_key(self, session: requests.Session):
+        """Apply API key authentication (header or query)."""
+        params = self.params
+        api_key = params.get('api_key')
+        key_name = params.get('key_name', 'X-API-Key')
+        location = params.get('location', 'header')
+
+        if location == 'header':
+            session.headers[key_name] = api_key
+            logger.debug(f"Applied API key to header: {key_name}")
+        elif location == 'query':
+            # Will be added per-request
+            session.params = {key_name: api_key}
+            logger.debug(f"Applied API key to query param: {key_name}")
+
+    def _apply_cookie(self, session: requests.Session):
+        """Apply cookie-based authentication."""
+        cookies = self.params.get('cookies', {})
+        for name, value in cookies.items():
+            session.cookies.set(name, value)
+        logger.debug(f"Applied {len(cookies)} cookies")
+
+    def _apply_custom_header(self, session: requests.Session):
+        """Apply custom header authentication."""
+        headers = self.params.get('headers', {})
+        session.headers.update(headers)
+        logger.debug(f"Applied {len(headers)} custom headers")
+
+    # Dispatch table: auth type -> handler
+    _HANDLERS = {
+        AuthType.BASIC: _apply_basic,
+        AuthType.BEARER: _apply_bearer,
+        AuthType.API_KEY: _apply_api_key,
+        AuthType.COOKIE: _apply_cookie,
+        AuthType.CUSTOM_HEADER: _apply_custom_header,
+    }
 
 
 class OAuth2Handler:
     """
     OAuth 2.0 Client Credentials Flow handler.
 
-    Supports automatic token refresh.
+    Supports automatic token refresh. Concurrent callers share a single
+    in-flight refresh instead of each hitting the token endpoint.
     """
 
+    # Refresh this many seconds before expiry to keep refreshes off hot paths
+    REFRESH_BUFFER = 300
+
     def __init__(
         self,
         token_url: str,
         client_id: str,
         client_secret: str,
-        scope: Optional[str] = None
+        scope: Optional[str] = None,
+        timeout: float = 10.0,
+        persist_token: bool = True
     ):
         """
         Initialize OAuth2 handler.
@@ -143,15 +219,96 @@ class OAuth2Handler:
             client_id: Client ID
             client_secret: Client secret
             scope: Optional scope string
+            timeout: Token request timeout in seconds
+            persist_token: Reuse still-valid tokens across handlers and
+                processes via an in-memory cache and the system keyring
         """
         self.token_url = token_url
         self.client_id = client_id
         self.client_secret = client_secret
         self.scope = scope
+        self.timeout = timeout
+        self.persist_token = persist_token
+
+        # Reuse one keep-alive connection to the token endpoint across refreshes
+        self._token_session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({'POST'})
+        )
+        self._token_session.mount('https://', HTTPAdapter(max_retries=retry))
+        self._token_session.mount('http://', HTTPAdapter(max_retries=retry))
 
         self.access_token: Optional[str] = None
         self.token_type: str = 'Bearer'
         self.expires_at: Optional[float] = None
+        self.refresh_at: float = 0.0
+        self._auth_header: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._refresh_event: Optional[threading.Event] = None
+
+        if persist_token:
+            self._restore_token()
+
+    @property
+    def _token_key(self) -> str:
+        """Identity of this client's token in the caches."""
+        return f'{self.token_url}|{self.client_id}|{self.scope or ""}'
+
+    def _restore_token(self):
+        """Load a still-valid token from the in-memory cache or keyring."""
+        key = self._token_key
+
+        with _token_cache_lock:
+            state = _token_cache.get(key)
+
+        if state is None:
+            try:
+                import keyring
+                stored = keyring.get_password(_KEYRING_SERVICE, key)
+                state = json.loads(stored) if stored else None
+            except Exception as e:
+                logger.debug(f"Keyring token lookup unavailable: {e}")
+                return
+
+        if not state or time.time() >= state.get('refresh_at', 0):
+            return
+
+        self.access_token = state['access_token']
+        self.token_type = state.get('token_type', 'Bearer')
+        self._auth_header = f'{self.token_type} {self.access_token}'
+        self.expires_at = state['expires_at']
+        self.refresh_at = state['refresh_at']
+        logger.debug("Reusing stored OAuth2 token")
+
+    def _store_token(self):
+        """Save the current token to the in-memory cache and keyring."""
+        key = self._token_key
+        state = {
+            'access_token': self.access_token,
+            'token_type': self.token_type,
+            'expires_at': self.expires_at,
+            'refresh_at': self.refresh_at
+        }
+
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+            _token_cache[key] = state
+            if len(_token_cache) > _TOKEN_CACHE_SIZE:
+                del _token_cache[next(iter(_token_cache))]
+
+        try:
+            import keyring
+            keyring.set_password(_KEYRING_SERVICE, key, json.dumps(state))
+        except Exception as e:
+            logger.debug(f"Keyring token storage unavailable: {e}")
+
+    def _token_valid(self) -> bool:
+        """Check whether the current token is outside the refresh window."""
+        return bool(self.access_token and time.time() < self.refresh_at)
 
     def get_token(self) -> str:
         """
@@ -160,14 +317,32 @@ class OAuth2Handler:
         Returns:
             Valid access token
         """
-        import time
+        while True:
+            with self._lock:
+                if self._token_valid():
+                    return self.access_token
+
+                event = self._refresh_event
+                is_leader = event is None
+                if is_leader:
+                    event = self._refresh_event = threading.Event()
+
+            if not is_leader:
+                # Another thread is refreshing; wait and re-check its result
+                event.wait()
+                continue
 
-        # Check if token is still valid
-        if self.access_token and self.expires_at:
-            if time.time() < self.expires_at - 60:  # 60s buffer
-                return self.access_token
+            try:
+                self._refresh_token()
+            finally:
+                with self._lock:
+                    self._refresh_event = None
+                event.set()
+
+            return self.access_token
 
-        # Request new token
+    def _refresh_token(self):
+        """Request a new token from the token endpoint."""
         logger.info("Requesting new OAuth2 token")
 
         data = {
@@ -179,26 +354,41 @@ class OAuth2Handler:
         if self.scope:
             data['scope'] = self.scope
 
-        response = requests.post(self.token_url, data=data)
+        response = self._token_session.post(
+            self.token_url,
+            data=data,
+            timeout=self.timeout
+        )
         response.raise_for_status()
 
         token_data = response.json()
 
         self.access_token = token_data['access_token']
         self.token_type = token_data.get('token_type', 'Bearer')
+        self._auth_header = f'{self.token_type} {self.access_token}'
         expires_in = token_data.get('expires_in', 3600)
-
-        import time
         self.expires_at = time.time() + expires_in
+        # Short-lived tokens refresh at half-life rather than immediately
+        self.refresh_at = self.expires_at - min(self.REFRESH_BUFFER, expires_in / 2)
+
+        if self.persist_token:
+            self._store_token()
 
         logger.info(f"Obtained new token, expires in {expires_in}s")
 
-        return self.access_token
+    def get_auth_header(self) -> str:
+        """
+        Get the Authorization header value (refreshes the token if needed).
+
+        Returns:
+            Header value such as "Bearer <token>"
+        """
+        self.get_token()
+        return self._auth_header
 
     def apply_to_session(self, session: requests.Session):
         """Apply OAuth2 authentication to session."""
-        token = self.get_token()
-        session.headers['Authorization'] = f'{self.token_type} {token}'
+        session.headers['Authorization'] = self.get_auth_header()
 
 
 class AuthManager:
@@ -208,51 +398,154 @@ class AuthManager:
     Manages credentials for multiple domains and provides authenticated sessions.
     """
 
-    def __init__(self, config_file: Optional[Path] = None):
+    def __init__(
+        self,
+        config_file: Optional[Path] = None,
+        pool_connections: int = 64,
+        pool_maxsize: int = 256,
+        user_agent: str = 'scrape-api-docs/0.2.0'
+    ):
         """
         Initialize authentication manager.
 
         Args:
             config_file: Optional path to credential config file
+            pool_connections: Number of host connection pools per session
+            pool_maxsize: Maximum pooled connections per host
+            user_agent: Default User-Agent for authenticated sessions
         """
         self.config_file = config_file or Path.home() / '.scraper_auth.json'
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.user_agent = user_agent
         self.credentials: Dict[str, Credential] = {}
         self.oauth_handlers: Dict[str, OAuth2Handler] = {}
 
+        # Per-domain session cache so connection pools are reused
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+
+        # Config file state for mtime-gated reloads and batched saves
+        self._config_mtime: Optional[float] = None
+        self._batch_depth = 0
+        self._dirty = False
+
         self._load_credentials()
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        return urlparse(url).netloc
+        return _extract_domain(url)
+
+    def _build_session(self) -> requests.Session:
+        """Create a session with a connection pool sized for concurrent crawls."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['User-Agent'] = self.user_agent
+        return session
+
+    def _invalidate_session(self, domain: str):
+        """Drop the cached session for domain so it is rebuilt on next use."""
+        with self._sessions_lock:
+            session = self._sessions.pop(domain, None)
+
+        if session is not None:
+            session.close()
 
     def _load_credentials(self):
-        """Load credentials from config file."""
-        if self.config_file.exists():
-            try:
+        """Load credentials from config file (skipped if unchanged on disk)."""
+        try:
+            mtime = self.config_file.stat().st_mtime
+        except FileNotFoundError:
+            return
+
+        if mtime == self._config_mtime:
+            return
+
+        try:
+            if ORJSON_AVAILABLE:
+                with open(self.config_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
                 with open(self.config_file, 'r') as f:
                     data = json.load(f)
 
-                for domain, cred_data in data.items():
-                    self.credentials[domain] = Credential.from_dict(cred_data)
+            for domain, cred_data in data.items():
+                self.credentials[domain] = Credential.from_dict(cred_data)
+                self._invalidate_session(domain)
 
-                logger.info(f"Loaded {len(self.credentials)} credentials")
-            except Exception as e:
-                logger.error(f"Failed to load credentials: {e}")
+            self._config_mtime = mtime
+            logger.info(f"Loaded {len(self.credentials)} credentials")
+        except Exception as e:
+            logger.error(f"Failed to load credentials: {e}")
 
     def _save_credentials(self):
-        """Save credentials to config file."""
+        """Save credentials to config file (deferred inside batch_update)."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+
+        # Write to a temp file and swap in atomically to avoid torn writes
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
         try:
             data = {
                 domain: cred.to_dict()
                 for domain, cred in self.credentials.items()
             }
 
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
-
+            # The file holds secrets: create it owner-only, then keep the
+            # mode of the file being replaced, if any
+            try:
+                mode = stat.S_IMODE(self.config_file.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o600
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb' if ORJSON_AVAILABLE else 'w') as f:
+                # A stale temp file keeps its old mode despite O_CREAT
+                os.chmod(tmp_file, mode)
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.config_file)
+
+            self._config_mtime = self.config_file.stat().st_mtime
+            self._dirty = False
             logger.info(f"Saved {len(self.credentials)} credentials")
         except Exception as e:
             logger.error(f"Failed to save credentials: {e}")
+            # Do not leave secrets behind in a half-written temp file
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+
+    def reload_credentials(self):
+        """Reload credentials if the config file changed on disk."""
+        self._load_credentials()
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Defer credential file writes until the block exits.
+
+        Example:
+            with auth.batch_update():
+                for domain, token in tokens.items():
+                    auth.add_credential(domain, AuthType.BEARER, token=token)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save_credentials()
 
     def add_credential(
         self,
@@ -277,6 +570,7 @@ class AuthManager:
             )
         """
         self.credentials[domain] = Credential(auth_type, **kwargs)
+        self._invalidate_session(domain)
         self._save_credentials()
         logger.info(f"Added {auth_type.value} credential for {domain}")
 
@@ -306,6 +600,7 @@ class AuthManager:
         )
 
         self.oauth_handlers[domain] = handler
+        self._invalidate_session(domain)
         logger.info(f"Added OAuth2 credential for {domain}")
 
     def get_credential(self, url: str) -> Optional[Credential]:
@@ -318,33 +613,47 @@ class AuthManager:
         Returns:
             Credential or None
         """
-        domain = self._extract_domain(url)
+        domain = _extract_domain(url)
         return self.credentials.get(domain)
 
     def get_authenticated_session(self, url: str) -> requests.Session:
         """
         Get authenticated session for URL.
 
+        Sessions are cached per domain so keep-alive connections are reused
+        across requests.
+
         Args:
             url: Target URL
 
         Returns:
             Configured requests.Session
         """
-        session = requests.Session()
-        domain = self._extract_domain(url)
+        domain = _extract_domain(url)
 
-        # Apply OAuth2 if available
-        if domain in self.oauth_handlers:
-            self.oauth_handlers[domain].apply_to_session(session)
-            return session
+        # Resolve the OAuth2 token before taking _sessions_lock: a refresh
+        # may POST to the token endpoint, and the handler already makes
+        # concurrent callers share one refresh
+        oauth_handler = self.oauth_handlers.get(domain)
+        auth_header = oauth_handler.get_auth_header() if oauth_handler else None
 
-        # Apply standard credential
-        credential = self.credentials.get(domain)
-        if credential:
-            credential.apply_to_session(session)
+        with self._sessions_lock:
+            session = self._sessions.get(domain)
 
-        return session
+            if session is None:
+                session = self._build_session()
+
+                # Apply standard credential unless OAuth2 is configured
+                credential = self.credentials.get(domain)
+                if credential and auth_header is None:
+                    credential.apply_to_session(session)
+
+                self._sessions[domain] = session
+
+            if auth_header is not None:
+                session.headers['Authorization'] = auth_header
+
+            return session
 
     def remove_credential(self, domain: str):
         """Remove credential for domain."""
@@ -356,6 +665,8 @@ class AuthManager:
         if domain in self.oauth_handlers:
             del self.oauth_handlers[domain]
 
+        self._invalidate_session(domain)
+
     def list_credentials(self) -> Dict[str, str]:
         """
         List all configured credentials.
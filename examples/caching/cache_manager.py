@@ -30,20 +30,37 @@ import json
 import pickle
 import sqlite3
 import time
-from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Any, Dict, Tuple
+from typing import Optional, Any, Dict, Tuple, Union
 import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bump when the DiskCache table layout changes; older caches are rebuilt
+_SCHEMA_VERSION = 6
+
+# Storage formats for DiskCache values
+FMT_RAW = 'raw'
+FMT_UTF8 = 'utf8'
+FMT_PICKLE = 'pickle'
+
+# Sentinel for single-probe dict lookups
+_MISS = object()
+
+
+def _key_hash(key: str) -> int:
+    """Map a cache key to a signed 64-bit integer for SQLite rowid lookups."""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
 
 class LRUCache:
     """
     Thread-safe in-memory LRU (Least Recently Used) cache.
 
-    Provides O(1) get and set operations with automatic eviction.
+    Provides O(1) get and set operations with automatic eviction. Relies on
+    dict insertion order: re-inserting a key moves it to the MRU end.
     """
 
     def __init__(self, max_size: int = 100):
@@ -54,7 +71,7 @@ class LRUCache:
             max_size: Maximum number of items to cache
         """
         self.max_size = max_size
-        self.cache: OrderedDict = OrderedDict()
+        self.cache: Dict[str, Tuple[Any, float]] = {}
         self.hits = 0
         self.misses = 0
         self.evictions = 0
@@ -71,14 +88,15 @@ class LRUCache:
             Tuple of (value, timestamp) or None
         """
         with self.lock:
-            if key in self.cache:
-                # Move to end (most recently used)
-                self.cache.move_to_end(key)
-                self.hits += 1
-                return self.cache[key]
+            entry = self.cache.pop(key, _MISS)
+            if entry is _MISS:
+                self.misses += 1
+                return None
 
-            self.misses += 1
-            return None
+            # Re-insert at the end (most recently used)
+            self.cache[key] = entry
+            self.hits += 1
+            return entry
 
     def set(self, key: str, value: Any, timestamp: float = None):
         """
@@ -92,26 +110,18 @@ class LRUCache:
         timestamp = timestamp or time.time()
 
         with self.lock:
-            if key in self.cache:
-                # Update existing
-                self.cache.move_to_end(key)
-                self.cache[key] = (value, timestamp)
-            else:
-                # Add new
-                if len(self.cache) >= self.max_size:
-                    # Evict oldest
-                    self.cache.popitem(last=False)
-                    self.evictions += 1
-
-                self.cache[key] = (value, timestamp)
+            # Drop any existing entry so the re-insert lands at the end
+            if self.cache.pop(key, _MISS) is _MISS and len(self.cache) >= self.max_size:
+                # Evict oldest
+                del self.cache[next(iter(self.cache))]
+                self.evictions += 1
+
+            self.cache[key] = (value, timestamp)
 
     def delete(self, key: str) -> bool:
         """Delete item from cache."""
         with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-                return True
-            return False
+            return self.cache.pop(key, _MISS) is not _MISS
 
     def clear(self):
         """Clear all cached items."""
@@ -139,41 +149,88 @@ class DiskCache:
     Persistent disk-based cache using SQLite.
 
     Provides durable storage with automatic cleanup of expired entries.
+    Each thread keeps one long-lived connection in WAL mode, so readers
+    don't block each other and per-call connection setup is avoided.
+    Access statistics are buffered in memory and written in batches.
+
+    Thread safety: instances may be shared across threads. Reads (get,
+    find_duplicates, stats) run concurrently; writes (set, delete,
+    cleanup_expired, access-stat flushes) are serialized by ``lock``.
     """
 
-    def __init__(self, cache_dir: Path, db_name: str = 'cache.db'):
+    def __init__(
+        self,
+        cache_dir: Path,
+        db_name: str = 'cache.db',
+        touch_flush_threshold: int = 256
+    ):
         """
         Initialize disk cache.
 
         Args:
             cache_dir: Directory for cache storage
             db_name: SQLite database filename
+            touch_flush_threshold: Pending access updates before auto-flush
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.db_path = self.cache_dir / db_name
+        self._local = threading.local()
         self._init_db()
 
         self.hits = 0
         self.misses = 0
+        # Serializes writes; reads rely on WAL and per-thread connections
         self.lock = threading.Lock()
 
+        # key -> (pending access count, last accessed time); _touch_lock also
+        # guards the hit/miss counters
+        self._pending_touch: Dict[str, Tuple[int, float]] = {}
+        self._touch_lock = threading.Lock()
+        self.touch_flush_threshold = touch_flush_threshold
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's SQLite connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                isolation_level=None,
+                check_same_thread=False
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA mmap_size=268435456')
+            self._local.conn = conn
+        return conn
+
     def _init_db(self):
         """Initialize SQLite database schema."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
+
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            # Cached data is disposable; rebuild rather than migrate
+            cursor.execute('DROP TABLE IF EXISTS cache')
+            cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
 
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS cache (
-                key TEXT PRIMARY KEY,
+                key_hash INTEGER PRIMARY KEY,
+                key TEXT NOT NULL,
                 value BLOB,
+                fmt TEXT,
                 content_hash TEXT,
                 timestamp REAL,
                 ttl INTEGER,
+                expires_at REAL,
                 size INTEGER,
                 access_count INTEGER DEFAULT 0,
-                last_accessed REAL
+                last_accessed REAL,
+                etag TEXT,
+                last_modified TEXT
             )
         ''')
 
@@ -182,18 +239,54 @@ class DiskCache:
             ON cache(timestamp)
         ''')
 
+        # Partial index: only rows that can expire, for range cleanup
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_expires
+            ON cache(expires_at) WHERE expires_at > 0
+        ''')
+
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_content_hash
             ON cache(content_hash)
         ''')
 
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def _serialize(value: Any) -> Tuple[Union[bytes, memoryview], str]:
+        """
+        Serialize value for storage.
 
-    def _get_content_hash(self, value: Any) -> str:
-        """Generate content hash for deduplication."""
-        content_bytes = pickle.dumps(value)
-        return hashlib.sha256(content_bytes).hexdigest()
+        Bytes-like values and text are stored natively; only other objects
+        are pickled. Buffers are passed through as a memoryview so SQLite
+        binds them without an intermediate copy (they read back as bytes).
+
+        Returns:
+            Tuple of (blob, fmt)
+        """
+        if isinstance(value, bytes):
+            return value, FMT_RAW
+        if isinstance(value, (bytearray, memoryview)):
+            return memoryview(value).cast('B'), FMT_RAW
+        if isinstance(value, str):
+            return value.encode('utf-8'), FMT_UTF8
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), FMT_PICKLE
+
+    @staticmethod
+    def _deserialize(blob: bytes, fmt: str) -> Any:
+        """Restore a value stored by _serialize."""
+        if fmt == FMT_RAW:
+            return bytes(blob)
+        if fmt == FMT_UTF8:
+            return blob.decode('utf-8')
+        return pickle.loads(blob)
+
+    def _get_content_hash(self, content_bytes: Union[bytes, memoryview]) -> str:
+        """
+        Generate content hash for deduplication.
+
+        Uses a 128-bit BLAKE2b digest: identity only, not security, so the
+        faster hash is sufficient.
+        """
+        return hashlib.blake2b(content_bytes, digest_size=16).hexdigest()
 
     def get(self, key: str) -> Optional[Tuple[Any, dict]]:
         """
@@ -205,59 +298,152 @@ class DiskCache:
         Returns:
             Tuple of (value, metadata) or None
         """
-        with self.lock:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
+        # Reads run without self.lock: each thread has its own connection
+        # and WAL lets readers proceed concurrently with the writer.
+        cursor = self._conn().cursor()
 
-            cursor.execute('''
-                SELECT value, timestamp, ttl, content_hash,
-                       access_count, size
-                FROM cache
-                WHERE key = ?
-            ''', (key,))
+        cursor.execute('''
+            SELECT key, value, fmt, timestamp, ttl, expires_at, content_hash,
+                   access_count, size, etag, last_modified
+            FROM cache
+            WHERE key_hash = ?
+        ''', (_key_hash(key),))
 
-            row = cursor.fetchone()
+        row = cursor.fetchone()
 
-            if row:
-                value_blob, timestamp, ttl, content_hash, access_count, size = row
+        # Verify the stored key to guard against a 64-bit hash collision
+        if row and row[0] == key:
+            (_, value_blob, fmt, timestamp, ttl, expires_at, content_hash,
+             access_count, size, etag, last_modified) = row
 
-                # Check if expired
-                if ttl > 0 and time.time() - timestamp > ttl:
+            # Expired rows are treated as misses; cleanup_expired removes them
+            if expires_at > 0 and time.time() > expires_at:
+                with self._touch_lock:
                     self.misses += 1
-                    cursor.execute('DELETE FROM cache WHERE key = ?', (key,))
-                    conn.commit()
-                    conn.close()
-                    return None
-
-                # Update access stats
-                cursor.execute('''
-                    UPDATE cache
-                    SET access_count = access_count + 1,
-                        last_accessed = ?
-                    WHERE key = ?
-                ''', (time.time(), key))
-
-                conn.commit()
-                conn.close()
+                return None
 
+            # Buffer access stats instead of writing on every hit
+            with self._touch_lock:
+                pending, _ = self._pending_touch.get(key, (0, 0.0))
+                pending += 1
+                self._pending_touch[key] = (pending, time.time())
                 self.hits += 1
-                value = pickle.loads(value_blob)
+                should_flush = len(self._pending_touch) >= self.touch_flush_threshold
+
+            value = self._deserialize(value_blob, fmt)
+
+            metadata = {
+                'timestamp': timestamp,
+                'ttl': ttl,
+                'content_hash': content_hash,
+                'access_count': access_count + pending,
+                'size': size,
+                'etag': etag,
+                'last_modified': last_modified
+            }
 
-                metadata = {
-                    'timestamp': timestamp,
-                    'ttl': ttl,
-                    'content_hash': content_hash,
-                    'access_count': access_count + 1,
-                    'size': size
-                }
+            if should_flush:
+                self.flush_access_stats()
 
-                return (value, metadata)
+            return (value, metadata)
 
-            conn.close()
+        with self._touch_lock:
             self.misses += 1
+        return None
+
+    def get_stale(self, key: str) -> Optional[Tuple[Any, dict]]:
+        """
+        Get an entry regardless of expiry, for HTTP revalidation.
+
+        Only entries stored with an ETag or Last-Modified validator are
+        returned. Does not count as a hit or miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, metadata) or None
+        """
+        cursor = self._conn().cursor()
+
+        cursor.execute('''
+            SELECT key, value, fmt, etag, last_modified
+            FROM cache
+            WHERE key_hash = ?
+              AND (etag IS NOT NULL OR last_modified IS NOT NULL)
+        ''', (_key_hash(key),))
+
+        row = cursor.fetchone()
+        if not row or row[0] != key:
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 0):
+        _, value_blob, fmt, etag, last_modified = row
+        return (
+            self._deserialize(value_blob, fmt),
+            {'etag': etag, 'last_modified': last_modified}
+        )
+
+    def refresh(self, key: str, ttl: int = 0) -> bool:
+        """
+        Restart an entry's TTL without rewriting its value.
+
+        Args:
+            key: Cache key
+            ttl: Time-to-live in seconds (0 = no expiration)
+
+        Returns:
+            True if the entry exists
+        """
+        with self.lock:
+            cursor = self._conn().cursor()
+
+            timestamp = time.time()
+            expires_at = timestamp + ttl if ttl > 0 else 0
+
+            cursor.execute('''
+                UPDATE cache SET timestamp = ?, ttl = ?, expires_at = ?
+                WHERE key_hash = ? AND key = ?
+            ''', (timestamp, ttl, expires_at, _key_hash(key), key))
+            return cursor.rowcount > 0
+
+    def _flush_access_stats(self, cursor: sqlite3.Cursor):
+        """Write buffered access stats in a single transaction."""
+        with self._touch_lock:
+            pending = self._pending_touch
+            self._pending_touch = {}
+
+        if not pending:
+            return
+
+        cursor.execute('BEGIN')
+        try:
+            cursor.executemany('''
+                UPDATE cache
+                SET access_count = access_count + ?,
+                    last_accessed = ?
+                WHERE key_hash = ?
+            ''', [
+                (count, accessed, _key_hash(key))
+                for key, (count, accessed) in pending.items()
+            ])
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+    def flush_access_stats(self):
+        """Persist buffered access counts and last-accessed times."""
+        with self.lock:
+            self._flush_access_stats(self._conn().cursor())
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
         """
         Set item in disk cache.
 
@@ -265,39 +451,59 @@ class DiskCache:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (0 = no expiration)
+            etag: HTTP ETag validator for conditional requests
+            last_modified: HTTP Last-Modified validator
         """
         with self.lock:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
+            cursor = self._conn().cursor()
 
-            value_blob = pickle.dumps(value)
-            content_hash = self._get_content_hash(value)
+            value_blob, fmt = self._serialize(value)
+            content_hash = self._get_content_hash(value_blob)
             timestamp = time.time()
+            expires_at = timestamp + ttl if ttl > 0 else 0
             size = len(value_blob)
+            key_hash = _key_hash(key)
+
+            cursor.execute(
+                'SELECT key, content_hash, fmt FROM cache WHERE key_hash = ?',
+                (key_hash,)
+            )
+            row = cursor.fetchone()
+
+            if row == (key, content_hash, fmt):
+                # Unchanged content: refresh expiry without rewriting the blob
+                cursor.execute('''
+                    UPDATE cache SET timestamp = ?, ttl = ?, expires_at = ?,
+                                     etag = ?, last_modified = ?
+                    WHERE key_hash = ?
+                ''', (timestamp, ttl, expires_at, etag, last_modified, key_hash))
+                return
+
+            with self._touch_lock:
+                self._pending_touch.pop(key, None)
 
             cursor.execute('''
                 INSERT OR REPLACE INTO cache
-                (key, value, content_hash, timestamp, ttl, size,
-                 access_count, last_accessed)
-                VALUES (?, ?, ?, ?, ?, ?, 0, ?)
-            ''', (key, value_blob, content_hash, timestamp, ttl, size, timestamp))
-
-            conn.commit()
-            conn.close()
+                (key_hash, key, value, fmt, content_hash, timestamp, ttl,
+                 expires_at, size, access_count, last_accessed, etag,
+                 last_modified)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+            ''', (key_hash, key, value_blob, fmt, content_hash, timestamp, ttl,
+                  expires_at, size, timestamp, etag, last_modified))
 
     def delete(self, key: str) -> bool:
         """Delete item from cache."""
         with self.lock:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-
-            cursor.execute('DELETE FROM cache WHERE key = ?', (key,))
-            deleted = cursor.rowcount > 0
+            cursor = self._conn().cursor()
 
-            conn.commit()
-            conn.close()
+            with self._touch_lock:
+                self._pending_touch.pop(key, None)
 
-            return deleted
+            cursor.execute(
+                'DELETE FROM cache WHERE key_hash = ? AND key = ?',
+                (_key_hash(key), key)
+            )
+            return cursor.rowcount > 0
 
     def cleanup_expired(self) -> int:
         """
@@ -307,22 +513,17 @@ class DiskCache:
             Number of entries removed
         """
         with self.lock:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
+            cursor = self._conn().cursor()
+            self._flush_access_stats(cursor)
 
             current_time = time.time()
 
             cursor.execute('''
                 DELETE FROM cache
-                WHERE ttl > 0 AND (? - timestamp) > ttl
+                WHERE expires_at > 0 AND expires_at < ?
             ''', (current_time,))
 
-            removed = cursor.rowcount
-
-            conn.commit()
-            conn.close()
-
-            return removed
+            return cursor.rowcount
 
     def find_duplicates(self) -> Dict[str, list]:
         """
@@ -331,8 +532,7 @@ class DiskCache:
         Returns:
             Dictionary mapping content_hash to list of keys
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        cursor = self._conn().cursor()
 
         cursor.execute('''
             SELECT content_hash, GROUP_CONCAT(key) as keys
@@ -341,33 +541,30 @@ class DiskCache:
             HAVING COUNT(*) > 1
         ''')
 
-        duplicates = {
+        return {
             row[0]: row[1].split(',')
             for row in cursor.fetchall()
         }
 
-        conn.close()
-        return duplicates
-
     def stats(self) -> dict:
         """Get cache statistics."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        self.flush_access_stats()
+        cursor = self._conn().cursor()
 
         cursor.execute('''
             SELECT
                 COUNT(*) as count,
                 SUM(size) as total_size,
-                AVG(access_count) as avg_accesses,
-                SUM(CASE WHEN ttl > 0 AND (? - timestamp) > ttl
-                    THEN 1 ELSE 0 END) as expired
+                AVG(access_count) as avg_accesses
             FROM cache
-        ''', (time.time(),))
-
-        row = cursor.fetchone()
-        count, total_size, avg_accesses, expired = row
+        ''')
+        count, total_size, avg_accesses = cursor.fetchone()
 
-        conn.close()
+        cursor.execute('''
+            SELECT COUNT(*) FROM cache
+            WHERE expires_at > 0 AND expires_at < ?
+        ''', (time.time(),))
+        expired = cursor.fetchone()[0]
 
         total_requests = self.hits + self.misses
         hit_rate = self.hits / total_requests if total_requests > 0 else 0
@@ -382,6 +579,14 @@ class DiskCache:
             'hit_rate': hit_rate
         }
 
+    def close(self):
+        """Flush buffered access stats and close this thread's connection."""
+        self.flush_access_stats()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
 
 class CacheManager:
     """
@@ -443,24 +648,107 @@ class CacheManager:
         logger.debug(f"Cache miss: {key}")
         return None
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
         """
         Set item in both cache tiers.
 
+        Bytes-like values are routed through set_bytes; str and bytes are
+        stored without pickling on disk.
+
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live (uses default if None)
+            etag: HTTP ETag validator, kept for revalidation
+            last_modified: HTTP Last-Modified validator
         """
+        if isinstance(value, (bytearray, memoryview)):
+            self.set_bytes(key, value, ttl, etag, last_modified)
+            return
+
         ttl = ttl if ttl is not None else self.default_ttl
         timestamp = time.time()
 
         # Store in both tiers
         self.memory_cache.set(key, value, timestamp)
-        self.disk_cache.set(key, value, ttl)
+        self.disk_cache.set(key, value, ttl, etag, last_modified)
 
         logger.debug(f"Cached: {key} (ttl={ttl}s)")
 
+    def set_bytes(
+        self,
+        key: str,
+        data: Union[bytes, bytearray, memoryview],
+        ttl: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        Cache raw page bytes in both tiers from a single buffer.
+
+        The data is frozen into one immutable bytes object which the memory
+        tier holds and the disk tier binds via memoryview, so neither tier
+        pickles or copies it again. Reads return bytes.
+
+        Args:
+            key: Cache key
+            data: Raw content (e.g. fetched HTML)
+            ttl: Time-to-live (uses default if None)
+            etag: HTTP ETag validator, kept for revalidation
+            last_modified: HTTP Last-Modified validator
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+        timestamp = time.time()
+
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
+        self.memory_cache.set(key, data, timestamp)
+        self.disk_cache.set(key, memoryview(data), ttl, etag, last_modified)
+
+        logger.debug(f"Cached bytes: {key} ({len(data)} bytes, ttl={ttl}s)")
+
+    def get_stale(self, key: str) -> Optional[Tuple[Any, Optional[str], Optional[str]]]:
+        """
+        Get an expired-or-fresh entry that can be revalidated over HTTP.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, etag, last_modified) or None if the entry is
+            missing or was stored without validators
+        """
+        result = self.disk_cache.get_stale(key)
+        if result is None:
+            return None
+
+        value, validators = result
+        return value, validators['etag'], validators['last_modified']
+
+    def refresh(self, key: str, value: Any, ttl: Optional[int] = None):
+        """
+        Mark a revalidated entry fresh again without rewriting it on disk.
+
+        Args:
+            key: Cache key
+            value: The still-valid cached value
+            ttl: Time-to-live (uses default if None)
+        """
+        ttl = ttl if ttl is not None else self.default_ttl
+
+        self.memory_cache.set(key, value, time.time())
+        self.disk_cache.refresh(key, ttl)
+
+        logger.debug(f"Revalidated: {key} (ttl={ttl}s)")
+
     def delete(self, key: str):
         """Delete item from all cache tiers."""
         self.memory_cache.delete(key)
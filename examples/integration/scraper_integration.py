@@ -22,34 +22,157 @@ Usage:
     )
 
     scraper.scrape_site('https://api.example.com/docs')
+
+    # Or, from async code (connections are kept alive between calls):
+    await scraper.scrape_site_async('https://api.example.com/docs')
+    await scraper.aclose()
 """
 
+import asyncio
+import os
+import re
 import sys
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
-from urllib.parse import urljoin, urlparse
-from collections import deque
+from typing import Awaitable, Callable, Optional, Dict, List, Tuple, Union
+from urllib.parse import ParseResult, urljoin, urlparse
 import logging
 
 # Add examples directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bs4 import BeautifulSoup
+import aiofiles
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import markdownify
-import requests
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 # Import our enhanced modules
-from rate_limiting.rate_limiter import RateLimiter
+from rate_limiting.rate_limiter import RateLimiter, parse_retry_after
 from caching.cache_manager import CacheManager
 from auth.auth_manager import AuthManager, AuthType
 
 logger = logging.getLogger(__name__)
 
+# libxml2-backed parsing is several times faster than the pure-Python parser
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Strips site-name suffixes such as "Page | Site" or "Page - Site"
+_TITLE_CLEAN_RE = re.compile(r'\|.*$| - .*$')
+
+# Common main-content containers, matched in a single tree walk
+_CONTENT_SELECTOR = 'main, article, .main-content, #content'
+
+# Discovery-only crawls keep just the links, dropping the rest at parse time
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Navigation menus repeat the same hrefs on every page of a site
+_join_url = lru_cache(maxsize=8192)(urljoin)
+
+# Shared HTML -> Markdown converter
+_markdown_converter = markdownify.MarkdownConverter(
+    heading_style="ATX",
+    bullets="*"
+)
+
+
+def _split_link(url: str) -> Tuple[str, str, str]:
+    """
+    Strip query and fragment from an absolute URL and split out its host.
+
+    A plain string scan in place of urlparse, which dominates the link loop
+    on large crawls.
+
+    Returns:
+        Tuple of (clean URL, netloc, path); netloc is empty for URLs
+        without an authority such as ``mailto:``
+    """
+    clean = url.split('#', 1)[0].split('?', 1)[0]
+
+    authority = clean.find('://')
+    if authority < 0:
+        return clean, '', ''
+
+    host_start = authority + 3
+    path_start = clean.find('/', host_start)
+    if path_start < 0:
+        return clean, clean[host_start:], ''
+    return clean, clean[host_start:path_start], clean[path_start:]
+
+
+def _find_main_content(soup: BeautifulSoup) -> Optional[Tag]:
+    """Locate the main content element using common selectors."""
+    return soup.select_one(_CONTENT_SELECTOR)
+
+
+def _parse_page(
+    url: str,
+    html_content: str,
+    base_netloc: str,
+    base_path: str,
+    with_content: bool
+) -> Tuple[List[str], Optional[str], Optional[str]]:
+    """
+    Parse a fetched page. Runs in a worker process.
+
+    Args:
+        url: Page URL, used to resolve relative links
+        html_content: Page HTML
+        base_netloc: Only links on this host are returned
+        base_path: Only links under this path are returned
+        with_content: Also extract the title and main content
+
+    Returns:
+        Tuple of (in-scope links, page title, main content Markdown);
+        title and Markdown are None for discovery-only parses
+    """
+    if with_content:
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    else:
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_LINK_STRAINER)
+
+    links: Dict[str, None] = {}
+    for a_tag in soup.find_all('a', href=True):
+        clean_link, netloc, path = _split_link(_join_url(url, a_tag['href']))
+
+        # Same domain and path check
+        if netloc != base_netloc or not path.startswith(base_path):
+            continue
+
+        links[clean_link] = None
+
+    if not with_content:
+        return list(links), None, None
+
+    page_title = soup.title.string if soup.title and soup.title.string else url
+    page_title = _TITLE_CLEAN_RE.sub('', page_title).strip()
+
+    # Convert the parsed element directly rather than serializing it and
+    # having markdownify parse it again
+    main_content = _find_main_content(soup)
+    markdown_content = (
+        _markdown_converter.convert_soup(main_content) if main_content else None
+    )
+
+    return list(links), page_title, markdown_content
+
 
 class EnhancedScraper:
     """
     Enhanced documentation scraper with rate limiting, caching, and auth.
+
+    Pages are fetched concurrently over a shared aiohttp session, with
+    in-flight requests bounded by ``max_concurrency``. HTML parsing and
+    Markdown conversion run in a process pool, so they overlap with
+    network I/O and use multiple cores.
     """
 
     def __init__(
@@ -59,7 +182,9 @@ class EnhancedScraper:
         cache_ttl: int = 3600,
         max_memory_cache: int = 100,
         enable_auth: bool = False,
-        timeout: int = 10
+        timeout: int = 10,
+        max_concurrency: int = 8,
+        parse_workers: Optional[int] = None
     ):
         """
         Initialize enhanced scraper.
@@ -71,8 +196,19 @@ class EnhancedScraper:
             max_memory_cache: Max items in memory cache
             enable_auth: Enable authentication support
             timeout: Request timeout in seconds
+            max_concurrency: Maximum concurrent page fetches
+            parse_workers: Processes for parsing pages (defaults to CPU count)
         """
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.parse_workers = parse_workers
+
+        # Keep-alive session, bound to the event loop it was created in
+        # (see _get_http); reused across calls until aclose()
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
 
         # Initialize rate limiter
         self.rate_limiter = RateLimiter(
@@ -97,6 +233,7 @@ class EnhancedScraper:
             'pages_processed': 0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'revalidated': 0,
             'errors': 0,
             'start_time': None,
             'end_time': None
@@ -104,13 +241,68 @@ class EnhancedScraper:
 
         logger.info("Enhanced scraper initialized")
 
-    def _get_session(self, url: str) -> requests.Session:
-        """Get appropriate session (authenticated or not)."""
-        if self.auth_manager:
-            return self.auth_manager.get_authenticated_session(url)
-        return requests.Session()
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """
+        Get the keep-alive HTTP session for the running event loop.
+
+        The session and its connection pool persist across fetches and
+        crawls, so TCP/TLS connections are reused instead of re-established.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.max_concurrency,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._http_loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._http
+
+    async def aclose(self):
+        """Close the keep-alive HTTP session."""
+        if self._http is not None:
+            await self._http.close()
+        self._http = None
+        self._http_loop = None
+        self._semaphore = None
+
+    def _run(self, coro):
+        """Run a coroutine to completion, closing the session before the loop ends."""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(runner())
+
+    async def _auth_request_kwargs(self, url: str) -> dict:
+        """
+        Build aiohttp request arguments from the authenticated session.
+
+        AuthManager configures requests sessions; their headers, cookies
+        and query params are carried over to the aiohttp request.
+        """
+        if not self.auth_manager:
+            return {}
+
+        # May refresh an OAuth2 token over the network, so keep it off the loop
+        session = await asyncio.to_thread(
+            self.auth_manager.get_authenticated_session, url
+        )
+        return {
+            'headers': dict(session.headers),
+            'cookies': session.cookies.get_dict(),
+            'params': session.params or None
+        }
 
-    def _fetch_url(self, url: str) -> Optional[str]:
+    async def _fetch_url(self, url: str) -> Optional[str]:
         """
         Fetch URL with rate limiting and caching.
 
@@ -131,99 +323,183 @@ class EnhancedScraper:
 
         # Rate-limited fetch
         try:
-            session = self._get_session(url)
-
-            with self.rate_limiter.acquire(url, timeout=30) as wait_time:
-                if wait_time > 0:
-                    logger.info(f"Waited {wait_time:.2f}s for rate limit")
-
-                response = session.get(url, timeout=self.timeout)
-                self.rate_limiter.record_response(url, response.status_code)
-
-                response.raise_for_status()
-                content = response.text
-
-                # Cache the result
-                self.cache_manager.set(url, content)
-
-                logger.info(f"Fetched: {url} ({response.status_code})")
-                return content
-
-        except requests.exceptions.RequestException as e:
+            http = await self._get_http()
+            request_kwargs = await self._auth_request_kwargs(url)
+
+            # Expired entries with validators are revalidated, not refetched
+            stale = self.cache_manager.get_stale(url)
+            if stale:
+                stale_content, etag, last_modified = stale
+                headers = request_kwargs.setdefault('headers', {})
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            async with self._semaphore:
+                async with self.rate_limiter.acquire_async(url, timeout=30) as wait_time:
+                    if wait_time > 0:
+                        logger.info(f"Waited {wait_time:.2f}s for rate limit")
+
+                    async with http.get(url, **request_kwargs) as response:
+                        self.rate_limiter.record_response(
+                            url,
+                            response.status,
+                            parse_retry_after(response.headers.get('Retry-After'))
+                        )
+
+                        if response.status == 304 and stale:
+                            self.cache_manager.refresh(url, stale_content)
+                            self.stats['revalidated'] += 1
+                            logger.info(f"Not modified: {url}")
+                            return stale_content
+
+                        response.raise_for_status()
+                        content = await response.text()
+
+            # Cache the result along with its validators
+            self.cache_manager.set(
+                url,
+                content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+
+            logger.info(f"Fetched: {url} ({response.status})")
+            return content
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.stats['errors'] += 1
             logger.error(f"Failed to fetch {url}: {e}")
             return None
 
-    def get_all_site_links(self, base_url: str) -> List[str]:
+    async def _crawl(
+        self,
+        base_url: str,
+        on_page: Optional[
+            Callable[[str, Optional[str], Optional[str]], Awaitable[None]]
+        ] = None
+    ) -> List[str]:
         """
         Crawl website to find all unique internal pages.
 
+        A pool of ``max_concurrency`` workers pulls URLs from a shared queue,
+        so page fetches overlap instead of running one after another. Each
+        page is parsed once in the process pool while other workers keep
+        fetching; links feed the queue and, when ``on_page`` is given, the
+        page title and Markdown are handed to it.
+
         Args:
             base_url: Starting URL
+            on_page: Optional callback receiving each page URL, title and
+                main content Markdown
 
         Returns:
             List of unique URLs
         """
-        to_visit = deque([base_url])
-        visited = {base_url}
-        all_links = {base_url}
+        owns_pool = self._parse_pool is None
+        if owns_pool:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
 
-        base_netloc = urlparse(base_url).netloc
-        base_path = urlparse(base_url).path
+        loop = asyncio.get_running_loop()
 
-        logger.info(f"Crawling {base_url} to discover pages...")
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(base_url)
+        # Single insertion-ordered index of every URL discovered so far
+        seen: Dict[str, None] = {base_url: None}
 
-        while to_visit:
-            current_url = to_visit.popleft()
+        parsed_base = urlparse(base_url)
+        base_netloc = parsed_base.netloc
+        base_path = parsed_base.path
 
-            html_content = self._fetch_url(current_url)
-            if not html_content:
-                continue
+        logger.info(f"Crawling {base_url} to discover pages...")
 
-            soup = BeautifulSoup(html_content, 'html.parser')
+        async def worker():
+            while True:
+                current_url = await queue.get()
+                try:
+                    html_content = await self._fetch_url(current_url)
+                    if not html_content:
+                        continue
+
+                    links, page_title, markdown_content = await loop.run_in_executor(
+                        self._parse_pool,
+                        _parse_page,
+                        current_url,
+                        html_content,
+                        base_netloc,
+                        base_path,
+                        on_page is not None
+                    )
 
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href']
-                absolute_link = urljoin(current_url, href)
+                    for link in links:
+                        if link not in seen:
+                            seen[link] = None
+                            queue.put_nowait(link)
+
+                    self.stats['pages_discovered'] = len(seen)
+
+                    if on_page is not None:
+                        await on_page(current_url, page_title, markdown_content)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    logger.error(f"Failed to crawl {current_url}: {e}")
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(self.max_concurrency)
+        ]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if owns_pool:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+
+        logger.info(f"Discovered {len(seen)} unique pages")
+        return sorted(seen)
+
+    async def get_all_site_links_async(self, base_url: str) -> List[str]:
+        """
+        Crawl website to find all unique internal pages.
 
-                parsed_link = urlparse(absolute_link)
-                clean_link = parsed_link._replace(query="", fragment="").geturl()
+        Args:
+            base_url: Starting URL
 
-                # Same domain and path check
-                if (urlparse(clean_link).netloc == base_netloc and
-                        urlparse(clean_link).path.startswith(base_path) and
-                        clean_link not in visited):
-                    visited.add(clean_link)
-                    all_links.add(clean_link)
-                    to_visit.append(clean_link)
+        Returns:
+            List of unique URLs
+        """
+        return await self._crawl(base_url)
+
+    def get_all_site_links(self, base_url: str) -> List[str]:
+        """
+        Crawl website to find all unique internal pages (blocking).
 
-            self.stats['pages_discovered'] = len(all_links)
+        Args:
+            base_url: Starting URL
 
-        logger.info(f"Discovered {len(all_links)} unique pages")
-        return sorted(list(all_links))
+        Returns:
+            List of unique URLs
+        """
+        return self._run(self.get_all_site_links_async(base_url))
 
-    def extract_main_content(self, html_content: str) -> str:
+    def extract_main_content(self, soup: BeautifulSoup) -> str:
         """
         Extract main documentation content.
 
         Args:
-            html_content: Full HTML content
+            soup: Parsed page, shared with title and link extraction
 
         Returns:
             Main content HTML
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Try common content selectors
-        main_content = soup.find('main')
-        if main_content:
-            return str(main_content)
-
-        main_content = soup.select_one('article, .main-content, #content')
-        if main_content:
-            return str(main_content)
-
-        return ""
+        main_content = _find_main_content(soup)
+        return str(main_content) if main_content else ""
 
     def convert_html_to_markdown(self, html_content: str) -> str:
         """
@@ -235,23 +511,19 @@ class EnhancedScraper:
         Returns:
             Markdown string
         """
-        return markdownify.markdownify(
-            html_content,
-            heading_style="ATX",
-            bullets="*"
-        )
+        return _markdown_converter.convert(html_content)
 
-    def generate_filename(self, base_url: str) -> str:
+    def generate_filename(self, base_url: Union[str, ParseResult]) -> str:
         """
         Generate output filename from URL.
 
         Args:
-            base_url: Source URL
+            base_url: Source URL, or its urlparse result
 
         Returns:
             Filename string
         """
-        parsed = urlparse(base_url)
+        parsed = urlparse(base_url) if isinstance(base_url, str) else base_url
         path_part = parsed.path.strip('/').replace('/', '_')
         domain_part = parsed.netloc.replace(".", "_")
 
@@ -259,7 +531,45 @@ class EnhancedScraper:
             return f"{domain_part}_documentation.md"
         return f"{domain_part}_{path_part}_documentation.md"
 
-    def scrape_site(
+    def _document_title(self, parsed_base: ParseResult) -> str:
+        """Title for the combined document, from the base URL's path or host."""
+        main_title = " ".join(
+            part.capitalize()
+            for part in parsed_base.path.strip('/').split('/')
+        )
+        return main_title or parsed_base.netloc
+
+    def _format_section(
+        self,
+        url: str,
+        page_title: str,
+        markdown_content: Optional[str]
+    ) -> Optional[str]:
+        """
+        Build the Markdown section for a processed page.
+
+        Args:
+            url: Page URL
+            page_title: Cleaned page title
+            markdown_content: Main content Markdown, None if not found
+
+        Returns:
+            Markdown section, or None if the page was skipped
+        """
+        logger.info(f"Processing: {url}")
+
+        if markdown_content is None:
+            logger.warning(f"No main content found: {url}")
+            return None
+
+        self.stats['pages_processed'] += 1
+        return (
+            f"## {page_title}\n\n"
+            f"**Original Page:** `{url}`\n\n"
+            f"{markdown_content}\n\n---\n\n"
+        )
+
+    async def scrape_site_async(
         self,
         base_url: str,
         output_filename: Optional[str] = None
@@ -278,60 +588,43 @@ class EnhancedScraper:
 
         logger.info(f"Starting scrape: {base_url}")
 
-        # Discover all pages
-        all_page_urls = self.get_all_site_links(base_url)
-
-        # Build documentation
-        full_documentation = ""
-
-        main_title = " ".join(
-            part.capitalize()
-            for part in urlparse(base_url).path.strip('/').split('/')
+        parsed_base = urlparse(base_url)
+        header = (
+            f"# Documentation for {self._document_title(parsed_base)}\n"
+            f"**Source:** {base_url}\n"
+            f"**Scraped:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
         )
-        full_documentation += f"# Documentation for {main_title or urlparse(base_url).netloc}\n"
-        full_documentation += f"**Source:** {base_url}\n"
-        full_documentation += f"**Scraped:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-        # Process each page
-        for url in all_page_urls:
-            logger.info(f"Processing: {url}")
-
-            html_content = self._fetch_url(url)
-            if not html_content:
-                continue
-
-            try:
-                soup = BeautifulSoup(html_content, 'html.parser')
-                page_title = soup.title.string if soup.title else url
-
-                # Clean title
-                import re
-                page_title = re.sub(r'\|.*$| - .*$', '', page_title).strip()
-
-                main_content_html = self.extract_main_content(html_content)
-
-                if main_content_html:
-                    markdown_content = self.convert_html_to_markdown(
-                        main_content_html
-                    )
-
-                    full_documentation += f"## {page_title}\n\n"
-                    full_documentation += f"**Original Page:** `{url}`\n\n"
-                    full_documentation += markdown_content
-                    full_documentation += "\n\n---\n\n"
-
-                    self.stats['pages_processed'] += 1
-                else:
-                    logger.warning(f"No main content found: {url}")
-
-            except Exception as e:
-                self.stats['errors'] += 1
-                logger.error(f"Failed to process {url}: {e}")
 
-        # Save output
-        filename = output_filename or self.generate_filename(base_url)
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(full_documentation)
+        filename = output_filename or self.generate_filename(parsed_base)
+
+        # Each section is spilled to its own temp file as its page finishes,
+        # so memory stays at one page rather than the whole corpus; the
+        # document is then assembled in sorted URL order, independent of
+        # which pages happened to finish first.
+        with tempfile.TemporaryDirectory(prefix='scrape-sections-') as sections_dir:
+            section_files: Dict[str, str] = {}
+
+            async def on_page(
+                url: str,
+                page_title: Optional[str],
+                markdown_content: Optional[str]
+            ):
+                section = self._format_section(url, page_title, markdown_content)
+                if section:
+                    # Claim the file name before awaiting so workers never share one
+                    path = os.path.join(sections_dir, f'{len(section_files)}.md')
+                    section_files[url] = path
+                    async with aiofiles.open(path, 'w', encoding='utf-8') as part:
+                        await part.write(section)
+
+            # Discover, process and spill pages in a single pass
+            await self._crawl(base_url, on_page=on_page)
+
+            async with aiofiles.open(filename, 'w', encoding='utf-8') as f:
+                await f.write(header)
+                for url in sorted(section_files):
+                    async with aiofiles.open(section_files[url], encoding='utf-8') as part:
+                        await f.write(await part.read())
 
         self.stats['end_time'] = time.time()
         duration = self.stats['end_time'] - self.stats['start_time']
@@ -340,6 +633,7 @@ class EnhancedScraper:
         logger.info(f"  Duration: {duration:.1f}s")
         logger.info(f"  Pages: {self.stats['pages_processed']}/{self.stats['pages_discovered']}")
         logger.info(f"  Cache hits: {self.stats['cache_hits']}")
+        logger.info(f"  Revalidated: {self.stats['revalidated']}")
         logger.info(f"  Errors: {self.stats['errors']}")
 
         return {
@@ -348,6 +642,23 @@ class EnhancedScraper:
             'output_file': filename
         }
 
+    def scrape_site(
+        self,
+        base_url: str,
+        output_filename: Optional[str] = None
+    ) -> Dict:
+        """
+        Scrape entire documentation site (blocking).
+
+        Args:
+            base_url: Starting URL
+            output_filename: Optional custom filename
+
+        Returns:
+            Statistics dictionary
+        """
+        return self._run(self.scrape_site_async(base_url, output_filename))
+
     def get_statistics(self) -> Dict:
         """Get comprehensive statistics."""
         return {
@@ -382,6 +693,8 @@ if __name__ == "__main__":
                         help="Disable caching")
     parser.add_argument('--auth', action='store_true',
                         help="Enable authentication")
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help="Maximum concurrent fetches (default: 8)")
     parser.add_argument('--output', help="Output filename")
 
     args = parser.parse_args()
@@ -389,7 +702,8 @@ if __name__ == "__main__":
     scraper = EnhancedScraper(
         requests_per_second=args.rate,
         cache_dir=args.cache_dir if not args.no_cache else '/tmp/no_cache',
-        enable_auth=args.auth
+        enable_auth=args.auth,
+        max_concurrency=args.concurrency
     )
 
     try:
@@ -17,29 +17,105 @@ Usage:
 
     limiter = RateLimiter(requests_per_second=2)
 
-    with limiter.acquire('example.com'):
-        response = requests.get(url)
+    limiter.acquire(url)
+    response = requests.get(url)
+
+The module is annotated throughout so it can be compiled with mypyc
+(``mypyc rate_limiter.py``); the resulting extension module is imported
+in place of this file with no code changes.
 """
 
+import asyncio
+import functools
+import random
 import time
 import threading
-from collections import defaultdict, deque
-from contextlib import contextmanager
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from contextlib import asynccontextmanager, contextmanager
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Final, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Recent-error tracking: the count caps at MAX_TRACKED_ERRORS and loses one
+# error per ERROR_DECAY_WINDOW seconds since the last one
+MAX_TRACKED_ERRORS: Final = 10
+ERROR_DECAY_WINDOW: Final = 60.0
+
+
+@functools.lru_cache(maxsize=8192)
+def _domain_of(url: str) -> str:
+    """Extract netloc from URL (memoized; acquire and record_response share a URL)."""
+    return urlsplit(url).netloc
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or malformed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    # A "-0000" zone parses as naive, but HTTP dates are always UTC
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class DomainStats:
+    """Request counters for one domain."""
+
+    __slots__ = ('requests', 'throttled', 'errors', 'last_request')
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.errors: int = 0
+        self.last_request: Optional[float] = None
+
+    def as_dict(self) -> dict:
+        """Return the counters as a plain dictionary."""
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'errors': self.errors,
+            'last_request': self.last_request
+        }
+
 
 class TokenBucket:
     """
     Token bucket algorithm implementation for rate limiting.
 
     Allows bursts up to capacity while maintaining average rate.
+
+    The only mutable state is a "zero time": the instant at which the bucket
+    would have been empty. The token count is derived from it on demand, so
+    a consume is one read and one write of that value and wait_time can
+    read it without locking.
+
+    Time is kept in integer nanoseconds (time.monotonic_ns()) and a token is
+    worth a fixed whole number of them, so refill and consume are exact
+    integer arithmetic and no rounding error builds up over a long run.
     """
 
-    def __init__(self, rate: float, capacity: float):
+    def __init__(self, rate: float, capacity: float) -> None:
         """
         Initialize token bucket.
 
@@ -47,11 +123,33 @@ class TokenBucket:
             rate: Tokens added per second (requests per second)
             capacity: Maximum bucket size (max burst)
         """
-        self.rate = rate
-        self.capacity = capacity
-        self.tokens = capacity
-        self.last_update = time.time()
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._ns_per_token: int = round(1e9 / rate)
+        self._capacity_ns: int = round(capacity * self._ns_per_token)
+        self.last_update: int = time.monotonic_ns()
+        # Start full
+        self._zero_time: int = self.last_update - self._capacity_ns
         self.lock = threading.Lock()
+        # Waiters block here until their refill deadline instead of polling
+        self.cond = threading.Condition(self.lock)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens available as of the last update."""
+        credit = min(self._capacity_ns, self.last_update - self._zero_time)
+        return credit / self._ns_per_token
+
+    def _try_consume(self, tokens: int, now: int) -> bool:
+        """Consume tokens if available at ``now`` (ns). Caller holds lock."""
+        available = min(self._capacity_ns, now - self._zero_time)
+        cost = tokens * self._ns_per_token
+        if available < cost:
+            return False
+
+        self._zero_time = now - (available - cost)
+        self.last_update = now
+        return True
 
     def consume(self, tokens: int = 1) -> bool:
         """
@@ -63,22 +161,48 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False otherwise
         """
+        now = time.monotonic_ns()
+        # _zero_time only ever moves forward, so an unlocked (possibly stale)
+        # read can only overstate what is available: if even that falls
+        # short, fail without touching the lock
+        if now - self._zero_time < tokens * self._ns_per_token:
+            return False
+
         with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
+            return self._try_consume(tokens, now)
 
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.capacity,
-                self.tokens + elapsed * self.rate
-            )
-            self.last_update = now
+    def acquire(self, tokens: int = 1, deadline: Optional[float] = None) -> bool:
+        """
+        Block until tokens can be consumed.
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
+        Each waiter sleeps on the bucket's condition until the exact time its
+        deficit is refilled, then consumes under the same lock.
+
+        Args:
+            tokens: Number of tokens to consume
+            deadline: Absolute time (time.monotonic()) to give up at, or None
+
+        Returns:
+            True if tokens were consumed, False if the deadline would pass
+            before enough tokens are available
+        """
+        if tokens > self.capacity:
+            # Can never be satisfied
             return False
 
+        cost = tokens * self._ns_per_token
+        with self.cond:
+            while True:
+                now = time.monotonic_ns()
+                if self._try_consume(tokens, now):
+                    return True
+
+                wait_ns = cost - (now - self._zero_time)
+                if deadline is not None and now + wait_ns > deadline * 1e9:
+                    return False
+
+                self.cond.wait(timeout=wait_ns / 1e9)
+
     def wait_time(self, tokens: int = 1) -> float:
         """
         Calculate time to wait until tokens are available.
@@ -89,12 +213,73 @@ class TokenBucket:
         Returns:
             Seconds to wait
         """
-        with self.lock:
-            if self.tokens >= tokens:
-                return 0.0
+        # A single attribute read; no lock needed
+        deficit = tokens * self._ns_per_token - (time.monotonic_ns() - self._zero_time)
+        return max(0, deficit) / 1e9
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for event-loop code.
+
+    Same integer zero-time bookkeeping as TokenBucket, but waiters are
+    coroutines sleeping until their tokens refill, so an acquire is a
+    single await with no thread hop. Holds no loop-bound primitives, so
+    a bucket outlives the event loop that first used it.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initialize async token bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum bucket size (max burst)
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._ns_per_token: int = round(1e9 / rate)
+        self._capacity_ns: int = round(capacity * self._ns_per_token)
+        # Start full
+        self._zero_time: int = time.monotonic_ns() - self._capacity_ns
+
+    def _try_consume(self, tokens: int, now: int) -> bool:
+        """Consume tokens if available at ``now`` (ns)."""
+        available = min(self._capacity_ns, now - self._zero_time)
+        cost = tokens * self._ns_per_token
+        if available < cost:
+            return False
 
-            deficit = tokens - self.tokens
-            return deficit / self.rate
+        self._zero_time = now - (available - cost)
+        return True
+
+    async def acquire(self, tokens: int = 1, deadline: Optional[float] = None) -> bool:
+        """
+        Wait until tokens can be consumed.
+
+        Args:
+            tokens: Number of tokens to consume
+            deadline: Absolute time (time.monotonic()) to give up at, or None
+
+        Returns:
+            True if tokens were consumed, False if the deadline would pass
+            before enough tokens are available
+        """
+        if tokens > self.capacity:
+            # Can never be satisfied
+            return False
+
+        cost = tokens * self._ns_per_token
+        while True:
+            now = time.monotonic_ns()
+            if self._try_consume(tokens, now):
+                return True
+
+            wait_ns = cost - (now - self._zero_time)
+            if deadline is not None and now + wait_ns > deadline * 1e9:
+                return False
+
+            await asyncio.sleep(wait_ns / 1e9)
 
 
 class RateLimiter:
@@ -106,6 +291,7 @@ class RateLimiter:
     - Automatic exponential backoff
     - 429/503 response handling
     - Configurable default limits
+    - Idle domains are forgotten, so memory stays bounded on long crawls
     """
 
     def __init__(
@@ -113,8 +299,10 @@ class RateLimiter:
         requests_per_second: float = 2.0,
         burst_size: Optional[int] = None,
         max_retries: int = 3,
-        backoff_factor: float = 2.0
-    ):
+        backoff_factor: float = 2.0,
+        max_domains: int = 4096,
+        domain_ttl: float = 3600.0
+    ) -> None:
         """
         Initialize rate limiter.
 
@@ -123,45 +311,135 @@ class RateLimiter:
             burst_size: Max burst (defaults to 2x rate)
             max_retries: Maximum retry attempts
             backoff_factor: Exponential backoff multiplier
+            max_domains: Domains to track before the least recently used
+                are forgotten
+            domain_ttl: Seconds after which an idle domain is forgotten
         """
-        self.requests_per_second = requests_per_second
-        self.burst_size = burst_size or int(requests_per_second * 2)
-        self.max_retries = max_retries
-        self.backoff_factor = backoff_factor
+        self.requests_per_second: float = requests_per_second
+        self.burst_size: int = burst_size or int(requests_per_second * 2)
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.max_domains: int = max_domains
+        self.domain_ttl: float = domain_ttl
+
+        # Custom per-domain rates from set_domain_limit; never evicted
+        self.domain_limits: Dict[str, float] = {}
 
-        # Per-domain buckets
+        # Per-domain buckets; acquire_async draws from its own set
         self.buckets: Dict[str, TokenBucket] = {}
-        self.domain_stats: Dict[str, dict] = defaultdict(
-            lambda: {
-                'requests': 0,
-                'throttled': 0,
-                'errors': 0,
-                'last_request': None
-            }
-        )
+        self.async_buckets: Dict[str, AsyncTokenBucket] = {}
+        self.domain_stats: Dict[str, DomainStats] = {}
 
         # Adaptive throttling state
         self.backoff_until: Dict[str, float] = {}
-        self.recent_errors: Dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=10)
-        )
+        # Recent errors per domain as a count plus the time of the last one;
+        # one error is forgiven per ERROR_DECAY_WINDOW seconds of quiet
+        self._err_count: Dict[str, int] = {}
+        self._err_last_ts: Dict[str, float] = {}
+
+        # Tracked domains in least-recently-used order, mapped to the
+        # time.monotonic() at which each was last used
+        self._last_seen: Dict[str, float] = {}
 
         self.lock = threading.Lock()
+        # Jitter source for backoff delays
+        self._rng: random.Random = random.Random()
+
+    @classmethod
+    def for_single_domain(
+        cls,
+        domain: str,
+        requests_per_second: float = 2.0,
+        **kwargs: Any
+    ) -> 'SingleDomainRateLimiter':
+        """
+        Create a limiter specialized for crawling one host.
+
+        Args:
+            domain: The host every request goes to
+            requests_per_second: Rate limit
+            **kwargs: Other RateLimiter arguments
+
+        Returns:
+            SingleDomainRateLimiter instance
+        """
+        return SingleDomainRateLimiter(domain, requests_per_second, **kwargs)
+
+    def _limits_for(self, domain: str) -> Tuple[float, int]:
+        """Return (requests_per_second, burst_size) for domain."""
+        rate = self.domain_limits.get(domain)
+        if rate is None:
+            return self.requests_per_second, self.burst_size
+        return rate, int(rate * 2)
 
     def _get_bucket(self, domain: str) -> TokenBucket:
         """Get or create token bucket for domain."""
-        if domain not in self.buckets:
-            with self.lock:
-                if domain not in self.buckets:
-                    self.buckets[domain] = TokenBucket(
-                        self.requests_per_second,
-                        self.burst_size
-                    )
-        return self.buckets[domain]
+        try:
+            return self.buckets[domain]
+        except KeyError:
+            # setdefault is atomic, so racing creators all get the same bucket
+            return self.buckets.setdefault(
+                domain,
+                TokenBucket(*self._limits_for(domain))
+            )
+
+    def _get_async_bucket(self, domain: str) -> AsyncTokenBucket:
+        """Get or create async token bucket for domain."""
+        try:
+            return self.async_buckets[domain]
+        except KeyError:
+            bucket = self.async_buckets[domain] = AsyncTokenBucket(
+                *self._limits_for(domain)
+            )
+            return bucket
+
+    def _touch(self, domain: str, now: float) -> None:
+        """Mark domain as most recently used, evicting stale domains if it is new."""
+        # Re-inserting moves the key to the end, keeping LRU order
+        if self._last_seen.pop(domain, None) is None:
+            self._evict_stale(now)
+        self._last_seen[domain] = now
+
+    def _evict_stale(self, now: float) -> None:
+        """
+        Forget idle domains.
+
+        Drops domains unused for domain_ttl seconds, then least recently
+        used ones until fewer than max_domains remain. Domains still in
+        backoff are kept.
+        """
+        last_seen = self._last_seen
+        if not last_seen:
+            return
+        cutoff = now - self.domain_ttl
+        # Cheap check first: the oldest entry decides whether there is work
+        oldest = next(iter(last_seen.values()))
+        if len(last_seen) < self.max_domains and oldest >= cutoff:
+            return
+
+        with self.lock:
+            excess = len(last_seen) - self.max_domains + 1
+            for domain, seen in list(last_seen.items()):
+                if excess <= 0 and seen >= cutoff:
+                    break
+                if self.backoff_until.get(domain, 0.0) > now:
+                    continue
+                self._forget(domain)
+                excess -= 1
+
+    def _forget(self, domain: str) -> None:
+        """Drop all per-domain state for domain. Caller holds lock."""
+        self._last_seen.pop(domain, None)
+        self.buckets.pop(domain, None)
+        self.async_buckets.pop(domain, None)
+        self.domain_stats.pop(domain, None)
+        self.backoff_until.pop(domain, None)
+        self._err_count.pop(domain, None)
+        self._err_last_ts.pop(domain, None)
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        return urlparse(url).netloc
+        return _domain_of(url)
 
     def _is_backed_off(self, domain: str) -> Optional[float]:
         """
@@ -171,75 +449,129 @@ class RateLimiter:
             Remaining backoff time in seconds, or None
         """
         if domain in self.backoff_until:
-            remaining = self.backoff_until[domain] - time.time()
+            remaining = self.backoff_until[domain] - time.monotonic()
             if remaining > 0:
                 return remaining
             else:
                 del self.backoff_until[domain]
         return None
 
-    def _trigger_backoff(self, domain: str, status_code: int):
-        """Trigger exponential backoff for domain."""
-        errors = self.recent_errors[domain]
-        errors.append((time.time(), status_code))
+    def _record_error(self, domain: str, now: float) -> int:
+        """Count an error for domain and return the decayed error count."""
+        count = self._err_count.get(domain, 0)
+        if count:
+            forgiven = int((now - self._err_last_ts[domain]) / ERROR_DECAY_WINDOW)
+            count = max(0, count - forgiven)
+        count = min(count + 1, MAX_TRACKED_ERRORS)
+
+        self._err_count[domain] = count
+        self._err_last_ts[domain] = now
+        return count
+
+    def _trigger_backoff(
+        self,
+        domain: str,
+        status_code: int,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Trigger exponential backoff for domain.
+
+        Args:
+            domain: Throttled domain
+            status_code: HTTP status code that triggered the backoff
+            retry_after: Server-requested delay in seconds, if any
+        """
+        now = time.monotonic()
+        error_count = self._record_error(domain, now)
 
         # Calculate backoff based on recent error count
-        backoff_seconds = min(
+        max_backoff = min(
             300,  # Max 5 minutes
-            self.backoff_factor ** len(errors)
+            self.backoff_factor ** error_count
         )
 
-        self.backoff_until[domain] = time.time() + backoff_seconds
+        # Equal jitter: keep half the delay, randomize the rest, so workers
+        # hit by the same 429 wave don't all retry at the same instant
+        backoff_seconds = max_backoff / 2 + self._rng.uniform(0, max_backoff / 2)
+
+        # Never come back before the server said we may
+        if retry_after is not None:
+            backoff_seconds = max(backoff_seconds, retry_after)
+
+        self.backoff_until[domain] = now + backoff_seconds
 
         logger.warning(
-            f"Rate limit exceeded for {domain}. "
-            f"Backing off for {backoff_seconds:.1f}s"
+            "Rate limit exceeded for %s. Backing off for %.1fs",
+            domain, backoff_seconds
         )
 
-    def record_response(self, url: str, status_code: int):
+    def record_response(
+        self,
+        url: str,
+        status_code: int,
+        retry_after: Optional[float] = None
+    ) -> None:
         """
         Record response for adaptive throttling.
 
         Args:
             url: Request URL
             status_code: HTTP status code
+            retry_after: Seconds from the response's Retry-After header,
+                see parse_retry_after()
         """
         domain = self._extract_domain(url)
-        stats = self.domain_stats[domain]
+        self._touch(domain, time.monotonic())
+        try:
+            stats = self.domain_stats[domain]
+        except KeyError:
+            stats = self.domain_stats.setdefault(domain, DomainStats())
 
-        stats['last_request'] = time.time()
-        stats['requests'] += 1
+        # Wall clock, since it is reported to callers; internal timing is monotonic
+        stats.last_request = time.time()
+        stats.requests += 1
 
         # Handle rate limiting responses
         if status_code in (429, 503):
-            stats['throttled'] += 1
-            self._trigger_backoff(domain, status_code)
+            stats.throttled += 1
+            self._trigger_backoff(domain, status_code, retry_after)
         elif status_code >= 500:
-            stats['errors'] += 1
+            stats.errors += 1
             # Don't backoff immediately on 5xx, but track
-            self.recent_errors[domain].append((time.time(), status_code))
+            self._record_error(domain, time.monotonic())
 
-    @contextmanager
-    def acquire(self, url: str, timeout: float = 60.0):
+    def acquire(self, url: str, timeout: float = 60.0, n: int = 1) -> float:
         """
-        Acquire rate limit token for URL.
+        Acquire rate limit token for URL, blocking until it is available.
 
         Usage:
-            with limiter.acquire(url) as waited:
-                response = requests.get(url)
-                limiter.record_response(url, response.status_code)
+            waited = limiter.acquire(url)
+            response = requests.get(url)
+            limiter.record_response(url, response.status_code)
 
         Args:
             url: Target URL
             timeout: Max wait time in seconds
+            n: Number of tokens to reserve, e.g. one per request in a batch
 
-        Yields:
+        Returns:
             Time waited in seconds
+
+        Raises:
+            ValueError: If n exceeds the domain's burst size
+            TimeoutError: If the tokens can't be acquired within timeout
         """
         domain = self._extract_domain(url)
+        start_time = time.monotonic()
+        self._touch(domain, start_time)
         bucket = self._get_bucket(domain)
+        if n > bucket.capacity:
+            raise ValueError(
+                f"Cannot acquire {n} tokens; burst size for {domain} "
+                f"is {bucket.capacity}"
+            )
 
-        start_time = time.time()
         total_waited = 0.0
 
         # Check for backoff period
@@ -250,24 +582,93 @@ class RateLimiter:
                     f"Backoff period ({backoff_remaining:.1f}s) "
                     f"exceeds timeout ({timeout}s)"
                 )
-            logger.info(f"Waiting {backoff_remaining:.1f}s for backoff")
+            logger.info("Waiting %.1fs for backoff", backoff_remaining)
             time.sleep(backoff_remaining)
             total_waited += backoff_remaining
 
         # Wait for token
-        while not bucket.consume():
-            wait_time = bucket.wait_time()
+        token_start = time.monotonic()
+        if not bucket.acquire(n, deadline=start_time + timeout):
+            raise TimeoutError(
+                f"Rate limit wait time exceeds timeout ({timeout}s)"
+            )
+        total_waited += time.monotonic() - token_start
+
+        return total_waited
+
+    @contextmanager
+    def acquire_cm(self, url: str, timeout: float = 60.0, n: int = 1) -> Iterator[float]:
+        """
+        Context manager form of acquire(), for code written against it.
+
+        Usage:
+            with limiter.acquire_cm(url) as waited:
+                response = requests.get(url)
+                limiter.record_response(url, response.status_code)
+
+        Yields:
+            Time waited in seconds
+        """
+        yield self.acquire(url, timeout, n)
+
+    @asynccontextmanager
+    async def acquire_async(
+        self,
+        url: str,
+        timeout: float = 60.0,
+        n: int = 1
+    ) -> AsyncIterator[float]:
+        """
+        Async variant of acquire() for use from event-loop code.
+
+        Waits on the domain's AsyncTokenBucket, so other coroutines keep
+        running and no thread is involved.
+
+        Usage:
+            async with limiter.acquire_async(url) as waited:
+                async with session.get(url) as response:
+                    limiter.record_response(url, response.status)
+
+        Args:
+            url: Target URL
+            timeout: Max wait time in seconds
+            n: Number of tokens to reserve, e.g. one per request in a batch
+
+        Yields:
+            Time waited in seconds
+
+        Raises:
+            ValueError: If n exceeds the domain's burst size
+            TimeoutError: If the tokens can't be acquired within timeout
+        """
+        domain = self._extract_domain(url)
+        start_time = time.monotonic()
+        self._touch(domain, start_time)
+        bucket = self._get_async_bucket(domain)
+        if n > bucket.capacity:
+            raise ValueError(
+                f"Cannot acquire {n} tokens; burst size for {domain} "
+                f"is {bucket.capacity}"
+            )
 
-            if time.time() - start_time + wait_time > timeout:
+        # Check for backoff period
+        backoff_remaining = self._is_backed_off(domain)
+        if backoff_remaining:
+            if backoff_remaining > timeout:
                 raise TimeoutError(
-                    f"Rate limit wait time exceeds timeout ({timeout}s)"
+                    f"Backoff period ({backoff_remaining:.1f}s) "
+                    f"exceeds timeout ({timeout}s)"
                 )
+            logger.info("Waiting %.1fs for backoff", backoff_remaining)
+            await asyncio.sleep(backoff_remaining)
 
-            logger.debug(f"Rate limited, waiting {wait_time:.2f}s for {domain}")
-            time.sleep(wait_time)
-            total_waited += wait_time
+        # Wait for token
+        if not await bucket.acquire(n, deadline=start_time + timeout):
+            raise TimeoutError(
+                f"Rate limit wait time exceeds timeout ({timeout}s)"
+            )
 
-        yield total_waited
+        yield time.monotonic() - start_time
 
     def get_stats(self, domain: Optional[str] = None) -> dict:
         """
@@ -280,21 +681,22 @@ class RateLimiter:
             Statistics dictionary
         """
         if domain:
+            stats = self.domain_stats.get(domain) or DomainStats()
             return {
                 'domain': domain,
-                **self.domain_stats[domain],
+                **stats.as_dict(),
                 'in_backoff': self._is_backed_off(domain) is not None
             }
 
         return {
             domain: {
-                **stats,
+                **stats.as_dict(),
                 'in_backoff': self._is_backed_off(domain) is not None
             }
             for domain, stats in self.domain_stats.items()
         }
 
-    def set_domain_limit(self, domain: str, requests_per_second: float):
+    def set_domain_limit(self, domain: str, requests_per_second: float) -> None:
         """
         Set custom rate limit for specific domain.
 
@@ -303,21 +705,86 @@ class RateLimiter:
             requests_per_second: Custom rate limit
         """
         with self.lock:
+            self.domain_limits[domain] = requests_per_second
             burst_size = int(requests_per_second * 2)
             self.buckets[domain] = TokenBucket(
                 requests_per_second,
                 burst_size
             )
-        logger.info(f"Set rate limit for {domain}: {requests_per_second} req/s")
+            self.async_buckets[domain] = AsyncTokenBucket(
+                requests_per_second,
+                burst_size
+            )
+        logger.info("Set rate limit for %s: %s req/s", domain, requests_per_second)
+
+
+class SingleDomainRateLimiter(RateLimiter):
+    """
+    RateLimiter for crawls that only talk to one host.
+
+    Every URL is charged to the same domain, so acquire() skips URL parsing,
+    bucket lookup and LRU bookkeeping. URLs for other hosts are not
+    rejected; they simply share the one bucket.
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        requests_per_second: float = 2.0,
+        **kwargs: Any
+    ) -> None:
+        """
+        Initialize single-domain rate limiter.
+
+        Args:
+            domain: The host every request goes to
+            requests_per_second: Rate limit
+            **kwargs: Other RateLimiter arguments
+        """
+        super().__init__(requests_per_second, **kwargs)
+        self.domain: str = domain
+        # Created through the generic path so they also appear in buckets
+        self._bucket: TokenBucket = RateLimiter._get_bucket(self, domain)
+        self._async_bucket: AsyncTokenBucket = RateLimiter._get_async_bucket(
+            self, domain
+        )
+
+    def _extract_domain(self, url: str) -> str:
+        """Every URL belongs to the fixed domain."""
+        return self.domain
+
+    def _get_bucket(self, domain: str) -> TokenBucket:
+        """Return the single token bucket."""
+        return self._bucket
+
+    def _get_async_bucket(self, domain: str) -> AsyncTokenBucket:
+        """Return the single async token bucket."""
+        return self._async_bucket
+
+    def _touch(self, domain: str, now: float) -> None:
+        """Nothing to track or evict with a single domain."""
+
+    def set_domain_limit(self, domain: str, requests_per_second: float) -> None:
+        """
+        Set custom rate limit for the domain.
+
+        Args:
+            domain: Target domain; only the fixed domain has any effect
+            requests_per_second: Custom rate limit
+        """
+        super().set_domain_limit(domain, requests_per_second)
+        if domain == self.domain:
+            self._bucket = self.buckets[domain]
+            self._async_bucket = self.async_buckets[domain]
 
 
 # Example integration with requests
 def rate_limited_get(
     url: str,
     limiter: RateLimiter,
-    session: Optional[object] = None,
-    **kwargs
-) -> object:
+    session: Optional[Any] = None,
+    **kwargs: Any
+) -> Any:
     """
     Make rate-limited HTTP GET request.
 
@@ -337,27 +804,31 @@ def rate_limited_get(
 
     while retry_count <= limiter.max_retries:
         try:
-            with limiter.acquire(url) as waited:
-                if waited > 0:
-                    logger.debug(f"Waited {waited:.2f}s for rate limit")
-
-                response = session.get(url, **kwargs)
-                limiter.record_response(url, response.status_code)
+            waited = limiter.acquire(url)
+            if waited > 0:
+                logger.debug("Waited %.2fs for rate limit", waited)
+
+            response = session.get(url, **kwargs)
+            limiter.record_response(
+                url,
+                response.status_code,
+                parse_retry_after(response.headers.get('Retry-After'))
+            )
 
-                # Handle rate limiting
-                if response.status_code in (429, 503):
-                    retry_count += 1
-                    if retry_count <= limiter.max_retries:
-                        logger.warning(
-                            f"Retry {retry_count}/{limiter.max_retries} "
-                            f"for {url}"
-                        )
-                        continue
+            # Handle rate limiting
+            if response.status_code in (429, 503):
+                retry_count += 1
+                if retry_count <= limiter.max_retries:
+                    logger.warning(
+                        "Retry %d/%d for %s",
+                        retry_count, limiter.max_retries, url
+                    )
+                    continue
 
-                return response
+            return response
 
         except TimeoutError as e:
-            logger.error(f"Rate limit timeout: {e}")
+            logger.error("Rate limit timeout: %s", e)
             raise
 
     raise Exception(f"Max retries ({limiter.max_retries}) exceeded for {url}")
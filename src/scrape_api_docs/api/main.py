@@ -9,21 +9,92 @@ job management, WebSocket progress tracking, and enterprise features.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
+import json
 import logging
+import os
+from typing import List
 
 from .routers import scrape, jobs, exports, auth, system
-from .middleware import LoggingMiddleware, RateLimitMiddleware
+from .middleware import (
+    LoggingMiddleware,
+    RateLimitMiddleware,
+    RequestIdLogFilter,
+    REDIS_AVAILABLE,
+)
+from .services.export_service import ExportService
 from .services.job_service import JobService
+from .services.scraper_service import ScraperService
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s'
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(RequestIdLogFilter())
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # noqa: F401  (needed by ORJSONResponse)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson encodes datetimes, UUIDs and dataclasses natively and much faster
+# than the stdlib encoder behind JSONResponse
+DefaultJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+if REDIS_AVAILABLE:
+    import redis.asyncio as aioredis
+
+
+async def _connect_redis():
+    """
+    Connect to Redis at REDIS_URL for shared rate-limit state.
+
+    Returns:
+        Redis client, or None if not configured or unreachable
+    """
+    redis_url = os.environ.get("REDIS_URL")
+    if not redis_url:
+        return None
+    if not REDIS_AVAILABLE:
+        logger.warning("REDIS_URL is set but redis is not installed; using local rate limiting")
+        return None
+
+    client = aioredis.from_url(redis_url)
+    try:
+        await client.ping()
+    except (aioredis.RedisError, OSError) as e:
+        logger.warning("Redis unavailable at startup, using local rate limiting: %s", e)
+        await client.aclose()
+        return None
+
+    logger.info("Using Redis for rate limiting")
+    return client
+
+
+def configured_workers() -> int:
+    """Number of uvicorn worker processes, from the API_WORKERS env var."""
+    return int(os.environ.get("API_WORKERS", "1"))
+
+
+def configured_job_concurrency() -> int:
+    """Jobs each worker process runs at once, from the JOB_CONCURRENCY env var."""
+    return int(os.environ.get("JOB_CONCURRENCY", "4"))
+
+
+def configured_cors_origins() -> List[str]:
+    """Allowed CORS origins, from the comma-separated CORS_ORIGINS env var."""
+    origins = [
+        origin.strip()
+        for origin in os.environ.get("CORS_ORIGINS", "").split(",")
+        if origin.strip()
+    ]
+    return origins or ["*"]
+
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
@@ -33,9 +104,20 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Documentation Scraper API v2.0.0")
 
     # Initialize services
-    job_service = JobService()
-    await job_service.initialize()
+    app.state.redis = await _connect_redis()
+    app.state.export_service = ExportService()
+    scraper_service = ScraperService()
+    await scraper_service.initialize()
+    app.state.scraper_service = scraper_service
+    job_service = JobService(concurrency=configured_job_concurrency())
+    await job_service.initialize(redis=app.state.redis)
     app.state.job_service = job_service
+    if app.state.redis is None and configured_workers() > 1:
+        logger.warning(
+            "Running multiple workers without Redis: rate limits apply per "
+            "worker, so clients get up to API_WORKERS times the configured "
+            "limit. Set REDIS_URL to share them."
+        )
 
     logger.info("API startup complete")
 
@@ -44,6 +126,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down API")
     await job_service.cleanup()
+    await scraper_service.cleanup()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
     logger.info("API shutdown complete")
 
 
@@ -59,21 +144,29 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=DefaultJSONResponse,
     lifespan=lifespan
 )
 
 
 # Add middleware (order matters - last added is executed first)
+# Level 6 compresses JSON nearly as well as the default 9 at about half the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(RateLimitMiddleware, requests_per_minute=60)
+
+# CORS runs first so preflight OPTIONS requests are answered without
+# logging or spending rate-limit tokens. Browsers reject credentialed
+# requests against a wildcard origin, so credentials are only allowed
+# when CORS_ORIGINS lists explicit origins.
+cors_origins = configured_cors_origins()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    allow_origins=cors_origins,
+    allow_credentials="*" not in cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-app.add_middleware(LoggingMiddleware)
-app.add_middleware(RateLimitMiddleware, requests_per_minute=60)
 
 
 # Include routers
@@ -104,19 +197,36 @@ app.include_router(
 )
 
 
+# Body of every 500 reply outside debug mode, where no details are exposed
+INTERNAL_ERROR_BODY = json.dumps({
+    "error": {
+        "code": "INTERNAL_ERROR",
+        "message": "An unexpected error occurred",
+        "details": None
+    }
+}).encode("utf-8")
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Handle unexpected exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+
+    if not app.debug:
+        return Response(
+            content=INTERNAL_ERROR_BODY,
+            status_code=500,
+            media_type="application/json"
+        )
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=500,
         content={
             "error": {
                 "code": "INTERNAL_ERROR",
                 "message": "An unexpected error occurred",
-                "details": str(exc) if app.debug else None
+                "details": str(exc)
             }
         }
     )
@@ -143,12 +253,20 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
+    # Auto-reload is for development only and forces a single worker
+    reload = os.environ.get("API_RELOAD", "").lower() in ("1", "true")
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=1 if reload else configured_workers(),
+        # uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
@@ -2,178 +2,341 @@
 Custom Middleware for FastAPI Application
 =========================================
 
-Includes logging, rate limiting, and request tracking middleware.
+Includes logging/request tracking and rate limiting middleware.
+
+Both are plain ASGI callables rather than BaseHTTPMiddleware subclasses,
+so a request costs one extra await per middleware instead of a task group
+and a buffered response stream.
 """
 
+import json
+import math
 import time
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, Tuple
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import uuid
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Health checks are never rate limited
+RATE_LIMIT_EXEMPT_PATHS = frozenset(("/health", "/api/v1/system/health"))
+
+# Seconds between sweeps of idle in-process rate-limit buckets
+BUCKET_SWEEP_INTERVAL = 60.0
+
+# ID of the request being handled in the current context, for log records
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class RequestIdLogFilter(logging.Filter):
     """
-    Request/Response logging middleware.
+    Attach the current request ID to log records.
+
+    Install on a handler whose format uses ``%(request_id)s``; records
+    logged outside a request get "-".
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add request_id to record if not present."""
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
 
-    Logs all HTTP requests with timing information.
+def get_request_id(scope: Scope) -> str:
     """
+    Get the request's tracing ID, assigning one on first use.
 
-    async def dispatch(self, request: Request, call_next):
+    Honors an inbound X-Request-ID header, otherwise generates a uuid4.
+    The ID is kept in the ASGI scope so every middleware sees the same one.
+    """
+    request_id = scope.get("request_id")
+    if request_id is None:
+        request_id = Headers(scope=scope).get("x-request-id") or uuid.uuid4().hex
+        scope["request_id"] = request_id
+    return request_id
+
+
+def _client_host(scope: Scope) -> str:
+    """Return the client IP from the ASGI scope."""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+# Token bucket for one client, run atomically inside Redis so every worker
+# and replica shares the same limit. Uses the Redis server clock to avoid
+# skew between API hosts. Returns {allowed, tokens}; tokens is a string
+# because Lua numbers are truncated to integers on the way out.
+RATE_LIMIT_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - last) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last', now)
+redis.call('EXPIRE', KEYS[1], ttl)
+return {allowed, tostring(tokens)}
+"""
+
+
+class LoggingMiddleware:
+    """
+    Request/Response logging and request ID middleware.
+
+    Logs all HTTP requests with timing information, and makes the request
+    ID available to every log record via request_id_var (see
+    RequestIdLogFilter) and to the client via the X-Request-ID header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize logging middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details."""
-        request_id = f"{int(time.time() * 1000)}-{id(request)}"
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = get_request_id(scope)
+        token = request_id_var.set(request_id)
         start_time = time.time()
 
         # Log request
         logger.info(
-            f"[{request_id}] {request.method} {request.url.path} "
-            f"from {request.client.host}"
+            "%s %s from %s",
+            scope["method"], scope["path"], _client_host(scope)
         )
 
-        # Process request
-        try:
-            response = await call_next(request)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration
+                duration = time.time() - start_time
 
-            # Calculate duration
-            duration = time.time() - start_time
+                # Log response
+                logger.info(
+                    "%s completed in %.3fs", message["status"], duration
+                )
 
-            # Log response
-            logger.info(
-                f"[{request_id}] {response.status_code} "
-                f"completed in {duration:.3f}s"
-            )
+                # Add custom headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{duration:.3f}"
 
-            # Add custom headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{duration:.3f}"
+            await send(message)
 
-            return response
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_headers)
 
         except Exception as e:
             duration = time.time() - start_time
             logger.error(
-                f"[{request_id}] Error after {duration:.3f}s: {e}",
+                "Error after %.3fs: %s", duration, e,
                 exc_info=True
             )
             raise
 
+        finally:
+            request_id_var.reset(token)
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Simple in-memory rate limiting middleware.
 
-    Implements token bucket algorithm per client IP.
-    For production, use Redis-based rate limiting.
+    Implements token bucket algorithm per client IP: each IP may burst up
+    to requests_per_minute requests, refilled at requests_per_minute / 60
+    tokens per second.
+
+    When the app has a Redis client in ``app.state.redis`` the buckets live
+    in Redis (see RATE_LIMIT_LUA), so the limit holds across workers and
+    replicas. If Redis is unreachable, buckets fall back to this process
+    and responses carry ``X-RateLimit-Mode: degraded-local``.
     """
 
-    def __init__(self, app, requests_per_minute: int = 60):
+    def __init__(self, app: ASGIApp, requests_per_minute: int = 60):
         """
         Initialize rate limiter.
 
         Args:
-            app: FastAPI application
+            app: Wrapped ASGI application
             requests_per_minute: Max requests per minute per IP
         """
-        super().__init__(app)
+        self.app = app
         self.requests_per_minute = requests_per_minute
-        self.window_size = 60  # seconds
-
-        # Store: {ip: [(timestamp, count)]}
-        self.request_history: Dict[str, list] = defaultdict(list)
-
-    def _clean_old_requests(self, ip: str, current_time: float):
-        """Remove requests outside the time window."""
-        cutoff_time = current_time - self.window_size
-        self.request_history[ip] = [
-            (timestamp, count)
-            for timestamp, count in self.request_history[ip]
-            if timestamp > cutoff_time
-        ]
-
-    def _get_request_count(self, ip: str, current_time: float) -> int:
-        """Get total requests in current window."""
-        self._clean_old_requests(ip, current_time)
-        return sum(count for _, count in self.request_history[ip])
-
-    async def dispatch(self, request: Request, call_next):
-        """Check rate limit and process request."""
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/api/v1/system/health"]:
-            return await call_next(request)
+        self.capacity = float(requests_per_minute)
+        self.refill_rate = requests_per_minute / 60.0  # tokens per second
+
+        # Store: {ip: [tokens, last_refill]}, last_refill on time.monotonic().
+        # Buckets are updated in place so each request does one dict lookup.
+        self.buckets: Dict[str, List[float]] = {}
+        self._last_sweep = time.monotonic()
+
+        # Redis keys (and local buckets) can expire once a bucket would have
+        # refilled completely
+        self.redis_ttl = math.ceil(self.capacity / self.refill_rate)
+        self._redis_script = None
+
+        # Serialized 429 bodies keyed by retry_after; only a handful of
+        # distinct values ever occur for a given rate
+        self._limited_bodies: Dict[int, bytes] = {}
+
+    def _limited_body(self, retry_after: int) -> bytes:
+        """Return the JSON body of a 429 reply, serialized once per retry_after."""
+        body = self._limited_bodies.get(retry_after)
+        if body is None:
+            body = json.dumps({
+                "error": {
+                    "code": "RATE_LIMIT_EXCEEDED",
+                    "message": (
+                        f"Rate limit exceeded. Maximum {self.requests_per_minute} "
+                        f"requests per minute allowed."
+                    ),
+                    "retry_after": retry_after
+                }
+            }).encode("utf-8")
+            self._limited_bodies[retry_after] = body
+        return body
+
+    def _evict_idle_buckets(self, now: float) -> None:
+        """
+        Drop buckets that have refilled completely.
 
-        client_ip = request.client.host
-        current_time = time.time()
+        A full bucket behaves exactly like a missing one, so evicting it
+        does not change any client's limit; it only keeps the dict from
+        growing with every IP ever seen.
+        """
+        cutoff = now - self.redis_ttl
+        idle = [ip for ip, (_, last_refill) in self.buckets.items() if last_refill < cutoff]
+        for ip in idle:
+            del self.buckets[ip]
+        self._last_sweep = now
+
+    def _take_local_token(self, client_ip: str) -> Tuple[bool, float]:
+        """Take a token from the in-process bucket for client_ip."""
+        now = time.monotonic()
+        if now - self._last_sweep >= BUCKET_SWEEP_INTERVAL:
+            self._evict_idle_buckets(now)
+
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            bucket = self.buckets[client_ip] = [self.capacity, now]
+
+        # Refill the bucket for the time since its last request
+        tokens = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        bucket[0] = tokens
+        bucket[1] = now
+        return allowed, tokens
+
+    async def _take_token(
+        self,
+        scope: Scope,
+        client_ip: str
+    ) -> Tuple[bool, float, Optional[str]]:
+        """
+        Take a token for client_ip, from Redis when configured.
 
-        # Get current request count
-        request_count = self._get_request_count(client_ip, current_time)
+        Returns:
+            Tuple of (allowed, tokens left, degraded mode header value or None)
+        """
+        app = scope.get("app")
+        redis = getattr(app.state, "redis", None) if app is not None else None
+        if redis is None:
+            return (*self._take_local_token(client_ip), None)
+
+        if self._redis_script is None:
+            # register_script uses EVALSHA and reloads the script on NOSCRIPT
+            self._redis_script = redis.register_script(RATE_LIMIT_LUA)
+
+        try:
+            allowed, tokens = await self._redis_script(
+                keys=[f"rl:{client_ip}"],
+                args=[self.refill_rate, self.capacity, self.redis_ttl]
+            )
+        except (RedisError, OSError) as e:
+            logger.warning("Redis rate limiting unavailable, using local buckets: %s", e)
+            return (*self._take_local_token(client_ip), "degraded-local")
+
+        return bool(allowed), float(tokens), None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check rate limit and process request."""
+        # Skip rate limiting for non-HTTP traffic and health checks
+        if scope["type"] != "http" or scope["path"] in RATE_LIMIT_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = _client_host(scope)
+        allowed, tokens, mode = await self._take_token(scope, client_ip)
+        mode_headers = {"X-RateLimit-Mode": mode} if mode else {}
 
         # Check limit
-        if request_count >= self.requests_per_minute:
-            logger.warning(f"Rate limit exceeded for {client_ip}")
+        if not allowed:
+            retry_after = math.ceil((1 - tokens) / self.refill_rate)
+            logger.warning("Rate limit exceeded for %s", client_ip)
 
-            return JSONResponse(
+            response = Response(
+                content=self._limited_body(retry_after),
                 status_code=429,
-                content={
-                    "error": {
-                        "code": "RATE_LIMIT_EXCEEDED",
-                        "message": (
-                            f"Rate limit exceeded. Maximum {self.requests_per_minute} "
-                            f"requests per minute allowed."
-                        ),
-                        "retry_after": self.window_size
-                    }
-                },
+                media_type="application/json",
                 headers={
-                    "Retry-After": str(self.window_size),
+                    "Retry-After": str(retry_after),
                     "X-RateLimit-Limit": str(self.requests_per_minute),
                     "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(current_time + self.window_size))
+                    "X-RateLimit-Reset": str(int(time.time() + retry_after)),
+                    **mode_headers
                 }
             )
-
-        # Record request
-        self.request_history[client_ip].append((current_time, 1))
-
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        remaining = self.requests_per_minute - request_count - 1
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, remaining))
-        response.headers["X-RateLimit-Reset"] = str(
-            int(current_time + self.window_size)
-        )
-
-        return response
-
-
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """
-    Add unique request ID to each request.
-
-    Useful for tracing requests across logs.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        """Add request ID header."""
-        request_id = request.headers.get(
-            "X-Request-ID",
-            f"req_{int(time.time() * 1000)}_{id(request)}"
-        )
-
-        # Store in request state
-        request.state.request_id = request_id
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers; reset is when the bucket will be
+                # full again
+                refill_seconds = (self.capacity - tokens) / self.refill_rate
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
+                headers["X-RateLimit-Remaining"] = str(int(tokens))
+                headers["X-RateLimit-Reset"] = str(
+                    int(time.time() + refill_seconds)
+                )
+                headers.update(mode_headers)
+
+            await send(message)
 
         # Process request
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_headers)
 
-        # Add to response
-        response.headers["X-Request-ID"] = request_id
 
-        return response
+# LoggingMiddleware now also assigns and returns the request ID
+RequestIDMiddleware = LoggingMiddleware
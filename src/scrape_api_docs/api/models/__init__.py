@@ -10,7 +10,8 @@ from .requests import (
     ScrapeOptions,
     AuthCredentials,
     AuthType,
-    Priority
+    Priority,
+    validate_http_url
 )
 from .responses import (
     JobResponse,
@@ -29,6 +30,7 @@ __all__ = [
     "AuthCredentials",
     "AuthType",
     "Priority",
+    "validate_http_url",
     # Responses
     "JobResponse",
     "JobStatus",
@@ -5,12 +5,73 @@ Request Models for API Endpoints
 Pydantic models for validating incoming requests.
 """
 
-from pydantic import BaseModel, HttpUrl, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 from typing import List, Optional, Dict
 from enum import Enum
 from scrape_api_docs.user_agents import validate_user_agent, UserAgents
 
 
+SUPPORTED_EXPORT_FORMATS = frozenset({'markdown', 'pdf', 'json', 'epub', 'html'})
+
+# Built once so every caller shares the compiled URL validator.
+_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+def validate_http_url(url: str) -> HttpUrl:
+    """
+    Validate a URL outside of a request model.
+
+    Args:
+        url: URL string to validate
+
+    Returns:
+        Parsed HttpUrl
+
+    Raises:
+        pydantic.ValidationError: If the URL is not a valid http(s) URL
+    """
+    return _URL_ADAPTER.validate_python(url)
+
+
+# OpenAPI examples for the request models
+_SCRAPE_OPTIONS_EXAMPLE = {
+    "render_javascript": False,
+    "max_depth": 10,
+    "include_patterns": ["*/docs/*", "*/api/*"],
+    "exclude_patterns": ["*/blog/*"],
+    "rate_limit": 2.0,
+    "timeout": 30,
+    "cache_enabled": True,
+    "cache_ttl": 3600,
+    "user_agent": "chrome_windows"
+}
+
+_AUTH_CREDENTIALS_EXAMPLE = {
+    "type": "bearer",
+    "token": "your_bearer_token_here"
+}
+
+_SCRAPE_REQUEST_EXAMPLE = {
+    "url": "https://docs.example.com",
+    "options": {
+        "render_javascript": False,
+        "max_depth": 10,
+        "rate_limit": 2.0,
+        "cache_enabled": True
+    },
+    "export_formats": ["markdown", "pdf"],
+    "priority": "normal"
+}
+
+
 class AuthType(str, Enum):
     """Supported authentication types."""
     NONE = "none"
@@ -83,7 +144,8 @@ class ScrapeOptions(BaseModel):
         description="Verify SSL certificates"
     )
 
-    @validator('user_agent')
+    @field_validator('user_agent')
+    @classmethod
     def validate_user_agent(cls, v):
         """Validate user agent string if provided."""
         if v is not None and not validate_user_agent(v):
@@ -93,20 +155,7 @@ class ScrapeOptions(BaseModel):
             )
         return v
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "render_javascript": False,
-                "max_depth": 10,
-                "include_patterns": ["*/docs/*", "*/api/*"],
-                "exclude_patterns": ["*/blog/*"],
-                "rate_limit": 2.0,
-                "timeout": 30,
-                "cache_enabled": True,
-                "cache_ttl": 3600,
-                "user_agent": "chrome_windows"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _SCRAPE_OPTIONS_EXAMPLE})
 
 
 class AuthCredentials(BaseModel):
@@ -134,27 +183,16 @@ class AuthCredentials(BaseModel):
         description="Cookie key-value pairs"
     )
 
-    @validator('username')
-    def validate_basic_auth(cls, v, values):
-        """Validate Basic auth requires username and password."""
-        if values.get('type') == AuthType.BASIC and not v:
+    @model_validator(mode='after')
+    def validate_required_fields(self):
+        """Validate the fields required by the chosen auth type."""
+        if self.type == AuthType.BASIC and not self.username:
             raise ValueError("Username required for Basic authentication")
-        return v
-
-    @validator('token')
-    def validate_bearer_auth(cls, v, values):
-        """Validate Bearer auth requires token."""
-        if values.get('type') == AuthType.BEARER and not v:
+        if self.type == AuthType.BEARER and not self.token:
             raise ValueError("Token required for Bearer authentication")
-        return v
+        return self
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "type": "bearer",
-                "token": "your_bearer_token_here"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _AUTH_CREDENTIALS_EXAMPLE})
 
 
 class ScrapeRequest(BaseModel):
@@ -188,32 +226,19 @@ class ScrapeRequest(BaseModel):
         description="Custom metadata for job tracking"
     )
 
-    @validator('export_formats')
+    @field_validator('export_formats')
+    @classmethod
     def validate_export_formats(cls, v):
         """Validate export formats are supported."""
-        supported = {'markdown', 'pdf', 'json', 'epub', 'html'}
-        invalid = set(v) - supported
+        invalid = set(v) - SUPPORTED_EXPORT_FORMATS
         if invalid:
             raise ValueError(
                 f"Unsupported export formats: {invalid}. "
-                f"Supported: {supported}"
+                f"Supported: {set(SUPPORTED_EXPORT_FORMATS)}"
             )
         return v
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "url": "https://docs.example.com",
-                "options": {
-                    "render_javascript": False,
-                    "max_depth": 10,
-                    "rate_limit": 2.0,
-                    "cache_enabled": True
-                },
-                "export_formats": ["markdown", "pdf"],
-                "priority": "normal"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _SCRAPE_REQUEST_EXAMPLE})
 
 
 class ValidationRequest(BaseModel):
@@ -155,17 +155,20 @@ class ValidationResponse(BaseModel):
     )
 
 
+_ERROR_EXAMPLE = {
+    "code": "INVALID_URL",
+    "message": "The provided URL is not accessible",
+    "details": {"url": "https://invalid.example.com"},
+    "timestamp": "2025-10-26T19:00:00Z"
+}
+
+
 class ErrorResponse(BaseModel):
     """Error response format."""
 
     error: Dict[str, Any] = Field(
         description="Error details",
-        example={
-            "code": "INVALID_URL",
-            "message": "The provided URL is not accessible",
-            "details": {"url": "https://invalid.example.com"},
-            "timestamp": "2025-10-26T19:00:00Z"
-        }
+        examples=[_ERROR_EXAMPLE]
     )
 
 
@@ -8,14 +8,28 @@ Endpoints for managing authentication credentials for protected sites.
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from typing import Optional, Dict
+from datetime import datetime, timezone
 import logging
+import uuid
 
 from ..models.requests import AuthType
 
+try:
+    # Time-ordered IDs keep credentials sorted by creation in any index
+    from uuid_utils import uuid7
+    UUID7_AVAILABLE = True
+except ImportError:
+    UUID7_AVAILABLE = False
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def new_credential_id() -> str:
+    """Generate a unique credential ID, time-ordered when uuid_utils is installed."""
+    return f"cred_{(uuid7() if UUID7_AVAILABLE else uuid.uuid4()).hex}"
+
+
 class CredentialRequest(BaseModel):
     """Request to store authentication credential."""
 
@@ -34,7 +48,7 @@ class CredentialResponse(BaseModel):
     credential_id: str = Field(description="Unique credential ID")
     domain: str = Field(description="Domain")
     auth_type: str = Field(description="Authentication type")
-    created_at: str = Field(description="Creation timestamp")
+    created_at: datetime = Field(description="Creation timestamp")
     expires_at: Optional[str] = Field(default=None, description="Expiration timestamp")
 
 
@@ -67,20 +81,20 @@ async def store_credential(request: CredentialRequest):
         # TODO: Implement credential storage with encryption
         # For now, return mock response
 
-        credential_id = f"cred_{int(time.time())}"
+        credential_id = new_credential_id()
 
-        logger.info(f"Stored {request.auth_type} credential for {request.domain}")
+        logger.info("Stored %s credential for %s", request.auth_type, request.domain)
 
         return CredentialResponse(
             credential_id=credential_id,
             domain=request.domain,
             auth_type=request.auth_type.value,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=datetime.now(timezone.utc),
             expires_at=request.expires_at
         )
 
     except Exception as e:
-        logger.error(f"Failed to store credential: {e}", exc_info=True)
+        logger.error("Failed to store credential: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to store credential")
 
 
@@ -101,7 +115,7 @@ async def list_credentials():
         }
 
     except Exception as e:
-        logger.error(f"Failed to list credentials: {e}", exc_info=True)
+        logger.error("Failed to list credentials: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to list credentials")
 
 
@@ -123,7 +137,7 @@ async def get_credential(credential_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get credential: {e}", exc_info=True)
+        logger.error("Failed to get credential: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to retrieve credential")
 
 
@@ -138,7 +152,7 @@ async def delete_credential(credential_id: str):
     try:
         # TODO: Implement credential deletion
 
-        logger.info(f"Deleted credential {credential_id}")
+        logger.info("Deleted credential %s", credential_id)
 
         return {
             "credential_id": credential_id,
@@ -146,10 +160,5 @@ async def delete_credential(credential_id: str):
         }
 
     except Exception as e:
-        logger.error(f"Failed to delete credential: {e}", exc_info=True)
+        logger.error("Failed to delete credential: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to delete credential")
-
-
-# Import for timestamp generation
-from datetime import datetime
-import time
@@ -6,15 +6,109 @@ Endpoints for downloading and managing exported documentation.
 """
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+from datetime import timezone
+from email.utils import formatdate, parsedate_to_datetime
 import logging
-from pathlib import Path
+import os
 
 from ..services.export_service import ExportService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+# Content types of the export formats, by lowercase file suffix
+MEDIA_TYPES = {
+    ".md": "text/markdown",
+    ".pdf": "application/pdf",
+    ".json": "application/json",
+    ".epub": "application/epub+zip",
+    ".html": "text/html"
+}
+
+
+class SendfileResponse(FileResponse):
+    """
+    FileResponse that lets the server sendfile(2) the body when it can.
+
+    Servers advertising the ASGI ``http.response.zerocopysend`` extension
+    copy the file to the socket in the kernel, so large exports never pass
+    through Python. Otherwise this behaves exactly like FileResponse.
+    """
+
+    def _can_zerocopy(self, scope: Scope) -> bool:
+        if ZEROCOPY_EXTENSION not in scope.get("extensions", {}):
+            return False
+        # GZipMiddleware rewrites body messages and would drop a
+        # zerocopysend message, so let it compress the regular way
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        return "gzip" not in accept_encoding
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._can_zerocopy(scope):
+            await super().__call__(scope, receive, send)
+            return
+
+        with open(self.path, "rb") as file:
+            self.set_stat_headers(os.fstat(file.fileno()))
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            if scope["method"].upper() == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            else:
+                await send({"type": ZEROCOPY_EXTENSION, "file": file, "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+
+def _etag_for(export_service: ExportService, file_path: str, file_stat: os.stat_result) -> str:
+    """
+    ETag for an export file.
+
+    The SHA256 from the metadata endpoint when it is already known, so no
+    file is hashed on the download path; otherwise a weak tag from the
+    file's mtime and size.
+    """
+    checksum = export_service.cached_checksum(file_path, file_stat)
+    if checksum is not None:
+        return f'"{checksum}"'
+    return f'W/"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+
+
+def _not_modified(headers: Headers, etag: str, mtime: float) -> bool:
+    """Check the request's conditional headers against an export's validators."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as required for If-None-Match
+        if if_none_match.strip() == "*":
+            return True
+        opaque = etag[2:] if etag.startswith("W/") else etag
+        return any(
+            (tag.strip()[2:] if tag.strip().startswith("W/") else tag.strip()) == opaque
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # A "-0000" zone parses as naive, but HTTP dates are always UTC
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return int(mtime) <= since.timestamp()
+
+    return False
+
 
 @router.get("/{job_id}/{filename}")
 async def download_export(job_id: str, filename: str, req: Request):
@@ -29,39 +123,45 @@ async def download_export(job_id: str, filename: str, req: Request):
     - **HTML** (.html): Single-page HTML
 
     Returns the file with appropriate Content-Type and Content-Disposition headers.
+    Supports conditional requests: a matching If-None-Match or
+    If-Modified-Since gets 304 Not Modified without the body.
     """
     try:
-        export_service = ExportService()
+        export_service: ExportService = req.app.state.export_service
 
-        # Get export file path
-        file_path = await export_service.get_export_file(job_id, filename)
+        # Get export file path and stat
+        export_file = await export_service.get_export_file(job_id, filename)
 
-        if not file_path or not Path(file_path).exists():
+        if not export_file:
             raise HTTPException(
                 status_code=404,
                 detail=f"Export file {filename} not found for job {job_id}"
             )
+        file_path, file_stat = export_file
 
-        # Determine media type
-        media_types = {
-            ".md": "text/markdown",
-            ".pdf": "application/pdf",
-            ".json": "application/json",
-            ".epub": "application/epub+zip",
-            ".html": "text/html"
+        validators = {
+            "ETag": _etag_for(export_service, file_path, file_stat),
+            "Last-Modified": formatdate(file_stat.st_mtime, usegmt=True),
+            "Cache-Control": "private, max-age=86400"
         }
+        if _not_modified(req.headers, validators["ETag"], file_stat.st_mtime):
+            return Response(status_code=304, headers=validators)
 
-        suffix = Path(filename).suffix.lower()
-        media_type = media_types.get(suffix, "application/octet-stream")
+        # Determine media type
+        dot = filename.rfind(".")
+        suffix = filename[dot:].lower() if dot >= 0 else ""
+        media_type = MEDIA_TYPES.get(suffix, "application/octet-stream")
 
         logger.info(f"Serving export {filename} for job {job_id}")
 
-        return FileResponse(
+        return SendfileResponse(
             path=file_path,
             media_type=media_type,
             filename=filename,
+            stat_result=file_stat,
             headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                **validators
             }
         )
 
@@ -73,7 +173,7 @@ async def download_export(job_id: str, filename: str, req: Request):
 
 
 @router.get("/{job_id}/metadata")
-async def get_export_metadata(job_id: str):
+async def get_export_metadata(job_id: str, req: Request):
     """
     Get metadata about available exports for a job.
 
@@ -85,7 +185,7 @@ async def get_export_metadata(job_id: str):
     - SHA256 checksums
     """
     try:
-        export_service = ExportService()
+        export_service: ExportService = req.app.state.export_service
 
         metadata = await export_service.get_export_metadata(job_id)
 
@@ -108,7 +208,7 @@ async def get_export_metadata(job_id: str):
 
 
 @router.post("/{job_id}/convert")
-async def convert_export(job_id: str, target_format: str):
+async def convert_export(job_id: str, target_format: str, req: Request):
     """
     Convert existing export to a different format.
 
@@ -119,7 +219,7 @@ async def convert_export(job_id: str, target_format: str):
     Returns conversion job ID and status URL.
     """
     try:
-        export_service = ExportService()
+        export_service: ExportService = req.app.state.export_service
 
         # Validate format
         supported_formats = {"pdf", "epub", "markdown", "json", "html"}
@@ -150,7 +250,7 @@ async def convert_export(job_id: str, target_format: str):
 
 
 @router.get("/conversions/{conversion_id}")
-async def get_conversion_status(conversion_id: str):
+async def get_conversion_status(conversion_id: str, req: Request):
     """
     Get status of an export conversion job.
 
@@ -161,7 +261,7 @@ async def get_conversion_status(conversion_id: str):
     - Error details (if failed)
     """
     try:
-        export_service = ExportService()
+        export_service: ExportService = req.app.state.export_service
 
         status = await export_service.get_conversion_status(conversion_id)
 
@@ -181,7 +281,7 @@ async def get_conversion_status(conversion_id: str):
 
 
 @router.delete("/{job_id}")
-async def delete_exports(job_id: str):
+async def delete_exports(job_id: str, req: Request):
     """
     Delete all export files for a job.
 
@@ -189,7 +289,7 @@ async def delete_exports(job_id: str):
     The job record itself is not deleted.
     """
     try:
-        export_service = ExportService()
+        export_service: ExportService = req.app.state.export_service
 
         deleted = await export_service.delete_exports(job_id)
 
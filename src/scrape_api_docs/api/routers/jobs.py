@@ -260,6 +260,8 @@ async def retry_failed_job(job_id: str, req: Request):
                 detail=f"Job {job_id} not found or cannot be retried"
             )
 
+        await job_service.submit_job(new_job.job_id)
+
         logger.info(f"Created retry job {new_job.job_id} for failed job {job_id}")
 
         return {
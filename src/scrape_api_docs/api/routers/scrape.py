@@ -5,9 +5,10 @@ Scraping Endpoints
 Endpoints for creating and managing scraping operations.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request
+import asyncio
 import logging
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 from ..models.requests import ScrapeRequest, ValidationRequest
@@ -18,11 +19,30 @@ from ..services.job_service import JobService
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Seconds /sync waits for its job before answering 504
+SYNC_JOB_TIMEOUT = 300.0
+
+# WebSocket URL prefixes by (scheme, Host header). Hosts come from clients,
+# so the cache stops growing at MAX_WS_PREFIXES entries.
+MAX_WS_PREFIXES = 64
+_ws_prefixes: Dict[Tuple[str, Optional[str]], str] = {}
+
+
+def _websocket_url(req: Request, job_id: str) -> str:
+    """Build the progress stream URL for a job, reusing the per-host prefix."""
+    key = (req.scope["scheme"], req.headers.get("host"))
+    prefix = _ws_prefixes.get(key)
+    if prefix is None:
+        ws_scheme = "wss" if req.url.scheme == "https" else "ws"
+        prefix = f"{ws_scheme}://{req.base_url.netloc}/api/v1/jobs/"
+        if len(_ws_prefixes) < MAX_WS_PREFIXES:
+            _ws_prefixes[key] = prefix
+    return f"{prefix}{job_id}/stream"
+
 
 @router.post("", response_model=JobResponse, status_code=202)
 async def create_scrape_job(
     request: ScrapeRequest,
-    background_tasks: BackgroundTasks,
     req: Request
 ):
     """
@@ -53,19 +73,13 @@ async def create_scrape_job(
             metadata=request.metadata
         )
 
-        # Queue background task
-        background_tasks.add_task(
-            job_service.execute_job,
-            job.job_id
-        )
+        # Queue for the job runners (shared Redis queue when configured)
+        await job_service.submit_job(job.job_id)
 
         logger.info(f"Created scraping job {job.job_id} for {request.url}")
 
         # Build WebSocket URL
-        websocket_url = None
-        if req.base_url:
-            ws_scheme = "wss" if req.url.scheme == "https" else "ws"
-            websocket_url = f"{ws_scheme}://{req.base_url.netloc}/api/v1/jobs/{job.job_id}/stream"
+        websocket_url = _websocket_url(req, job.job_id)
 
         return JobResponse(
             job_id=job.job_id,
@@ -107,8 +121,8 @@ async def create_sync_scrape_job(request: ScrapeRequest, req: Request):
             metadata=request.metadata
         )
 
-        # Execute synchronously
-        result = await job_service.execute_job(job.job_id)
+        # Run on the job pool and wait for the result
+        result = await job_service.run_job(job.job_id, timeout=SYNC_JOB_TIMEOUT)
 
         logger.info(f"Completed sync job {job.job_id} for {request.url}")
 
@@ -116,7 +130,7 @@ async def create_sync_scrape_job(request: ScrapeRequest, req: Request):
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except TimeoutError:
+    except asyncio.TimeoutError:
         raise HTTPException(
             status_code=504,
             detail="Scraping operation timed out. Use async endpoint for large sites."
@@ -127,7 +141,7 @@ async def create_sync_scrape_job(request: ScrapeRequest, req: Request):
 
 
 @router.post("/validate", response_model=ValidationResponse)
-async def validate_scrape_request(request: ValidationRequest):
+async def validate_scrape_request(request: ValidationRequest, req: Request):
     """
     Validate URL and scraping options without executing.
 
@@ -141,7 +155,7 @@ async def validate_scrape_request(request: ValidationRequest):
     Returns recommendations for optimal scraping configuration.
     """
     try:
-        scraper_service = ScraperService()
+        scraper_service: ScraperService = req.app.state.scraper_service
 
         # Validate URL
         validation_result = await scraper_service.validate_url(
@@ -157,7 +171,7 @@ async def validate_scrape_request(request: ValidationRequest):
 
 
 @router.post("/estimate", status_code=200)
-async def estimate_scrape_job(request: ScrapeRequest):
+async def estimate_scrape_job(request: ScrapeRequest, req: Request):
     """
     Estimate scraping job parameters without execution.
 
@@ -168,7 +182,7 @@ async def estimate_scrape_job(request: ScrapeRequest):
     - Cost estimation (if applicable)
     """
     try:
-        scraper_service = ScraperService()
+        scraper_service: ScraperService = req.app.state.scraper_service
 
         estimate = await scraper_service.estimate_job(
             url=str(request.url),
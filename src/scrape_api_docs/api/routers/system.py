@@ -7,6 +7,9 @@ Health checks, metrics, and system information endpoints.
 
 from fastapi import APIRouter, Request
 from fastapi.responses import PlainTextResponse
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+import asyncio
 import time
 import logging
 from datetime import datetime
@@ -19,6 +22,63 @@ logger = logging.getLogger(__name__)
 # Track startup time
 _startup_time = time.time()
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Seconds /stats and /metrics reuse one get_statistics() result
+STATS_CACHE_TTL = 5.0
+
+# Short-lived results of expensive calls: {key: (computed_at, value)}
+_cache: Dict[str, Tuple[float, Any]] = {}
+_cache_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# HELP/TYPE lines of the /metrics output, which never change
+_JOBS_HEADER = (
+    b"# HELP scraper_jobs_total Total number of scraping jobs\n"
+    b"# TYPE scraper_jobs_total counter\n"
+)
+_PAGES_HEADER = (
+    b"\n# HELP scraper_pages_scraped_total Total pages scraped\n"
+    b"# TYPE scraper_pages_scraped_total counter\n"
+)
+_CACHE_HIT_RATE_HEADER = (
+    b"\n# HELP scraper_cache_hit_rate Cache hit rate\n"
+    b"# TYPE scraper_cache_hit_rate gauge\n"
+)
+_AVG_DURATION_HEADER = (
+    b"\n# HELP scraper_avg_job_duration_seconds Average job duration\n"
+    b"# TYPE scraper_avg_job_duration_seconds gauge\n"
+)
+
+
+async def _cached(key: str, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return a cached result for key, recomputing it at most once per ttl.
+
+    Concurrent callers that miss the cache wait for a single call to
+    factory instead of each making their own.
+
+    Args:
+        key: Cache key
+        ttl: Seconds a result stays fresh
+        factory: Coroutine function computing the value
+
+    Returns:
+        Cached or freshly computed value
+    """
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+
+    async with _cache_locks[key]:
+        # Another request may have refreshed it while we waited
+        entry = _cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        value = await factory()
+        _cache[key] = (time.monotonic(), value)
+        return value
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check(req: Request):
@@ -80,7 +140,7 @@ async def get_system_stats(req: Request):
     try:
         job_service = req.app.state.job_service
 
-        stats = await job_service.get_statistics()
+        stats = await _cached("stats", STATS_CACHE_TTL, job_service.get_statistics)
 
         return SystemStats(
             jobs=stats.get("jobs", {}),
@@ -107,39 +167,26 @@ async def get_metrics(req: Request):
     """
     try:
         job_service = req.app.state.job_service
-        stats = await job_service.get_statistics()
+        stats = await _cached("stats", STATS_CACHE_TTL, job_service.get_statistics)
 
         jobs = stats.get("jobs", {})
         perf = stats.get("performance", {})
 
-        # Generate Prometheus metrics
-        metrics = []
-
-        # Job counts
-        metrics.append("# HELP scraper_jobs_total Total number of scraping jobs")
-        metrics.append("# TYPE scraper_jobs_total counter")
+        # Generate Prometheus metrics; only the sample values vary per scrape
+        buf = bytearray(_JOBS_HEADER)
         for status, count in jobs.items():
-            metrics.append(f'scraper_jobs_total{{status="{status}"}} {count}')
-
-        # Pages scraped
-        total_pages = perf.get("total_pages_scraped", 0)
-        metrics.append("\n# HELP scraper_pages_scraped_total Total pages scraped")
-        metrics.append("# TYPE scraper_pages_scraped_total counter")
-        metrics.append(f"scraper_pages_scraped_total {total_pages}")
-
-        # Cache hit rate
-        cache_rate = perf.get("cache_hit_rate", 0.0)
-        metrics.append("\n# HELP scraper_cache_hit_rate Cache hit rate")
-        metrics.append("# TYPE scraper_cache_hit_rate gauge")
-        metrics.append(f"scraper_cache_hit_rate {cache_rate:.3f}")
-
-        # Average job duration
-        avg_duration = perf.get("avg_job_duration", 0.0)
-        metrics.append("\n# HELP scraper_avg_job_duration_seconds Average job duration")
-        metrics.append("# TYPE scraper_avg_job_duration_seconds gauge")
-        metrics.append(f"scraper_avg_job_duration_seconds {avg_duration:.2f}")
-
-        return "\n".join(metrics)
+            buf += b'scraper_jobs_total{status="%s"} %d\n' % (status.encode(), count)
+
+        buf += _PAGES_HEADER
+        buf += b"scraper_pages_scraped_total %d\n" % perf.get("total_pages_scraped", 0)
+
+        buf += _CACHE_HIT_RATE_HEADER
+        buf += b"scraper_cache_hit_rate %.3f\n" % perf.get("cache_hit_rate", 0.0)
+
+        buf += _AVG_DURATION_HEADER
+        buf += b"scraper_avg_job_duration_seconds %.2f\n" % perf.get("avg_job_duration", 0.0)
+
+        return PlainTextResponse(bytes(buf), media_type=PROMETHEUS_CONTENT_TYPE)
 
     except Exception as e:
         logger.error(f"Failed to generate metrics: {e}", exc_info=True)
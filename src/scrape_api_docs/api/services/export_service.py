@@ -5,15 +5,22 @@ Export Service
 Manages export generation, conversion, and file serving.
 """
 
+import asyncio
 import logging
 import hashlib
+import os
+import stat
 import uuid
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import json
 
 logger = logging.getLogger(__name__)
 
+# Read size when hashing export files
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
 
 class ExportService:
     """
@@ -30,7 +37,18 @@ class ExportService:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-    async def get_export_file(self, job_id: str, filename: str) -> Optional[str]:
+        # SHA256 per export file: {path: (mtime_ns, size, checksum)}; a file
+        # is only rehashed when its mtime or size changes
+        self._checksums: Dict[str, Tuple[int, int, str]] = {}
+        # Serializes metadata builds per job so concurrent requests for the
+        # same job hash each file once
+        self._metadata_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def get_export_file(
+        self,
+        job_id: str,
+        filename: str
+    ) -> Optional[Tuple[str, os.stat_result]]:
         """
         Get path to export file.
 
@@ -39,13 +57,35 @@ class ExportService:
             filename: Export filename
 
         Returns:
-            Absolute file path or None if not found
+            Tuple of (file path, stat result) or None if not found
         """
         file_path = self.storage_dir / job_id / filename
 
-        if file_path.exists() and file_path.is_file():
-            return str(file_path)
+        # stat() off the event loop; storage may be a slow or network disk
+        try:
+            file_stat = await asyncio.to_thread(file_path.stat)
+        except OSError:
+            return None
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        return str(file_path), file_stat
+
+    def cached_checksum(self, file_path: str, file_stat: os.stat_result) -> Optional[str]:
+        """
+        Return a file's SHA256 if it was already computed for its current contents.
+
+        Args:
+            file_path: Export file path
+            file_stat: Current stat result of the file
 
+        Returns:
+            Hex checksum, or None if the file has not been hashed since it changed
+        """
+        cached = self._checksums.get(file_path)
+        if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return cached[2]
         return None
 
     async def get_export_metadata(self, job_id: str) -> Optional[Dict[str, Any]]:
@@ -65,19 +105,20 @@ class ExportService:
 
         exports = {}
 
-        for file_path in job_dir.glob("*"):
-            if file_path.is_file():
-                format_name = file_path.suffix.lstrip('.')
+        async with self._metadata_locks[job_id]:
+            for file_path in job_dir.glob("*"):
+                file_stat = file_path.stat()
+                if not stat.S_ISREG(file_stat.st_mode):
+                    continue
 
-                # Calculate checksum
-                checksum = self._calculate_checksum(file_path)
+                format_name = file_path.suffix.lstrip('.')
 
                 exports[format_name] = {
                     "available": True,
                     "url": f"/api/v1/exports/{job_id}/{file_path.name}",
-                    "size_bytes": file_path.stat().st_size,
-                    "created_at": file_path.stat().st_mtime,
-                    "checksum": checksum
+                    "size_bytes": file_stat.st_size,
+                    "created_at": file_stat.st_mtime,
+                    "checksum": await self._get_checksum(file_path, file_stat)
                 }
 
         return exports if exports else None
@@ -137,26 +178,48 @@ class ExportService:
         if not job_dir.exists():
             return 0
 
-        count = 0
-        for file_path in job_dir.glob("*"):
-            if file_path.is_file():
-                file_path.unlink()
-                count += 1
+        with os.scandir(job_dir) as entries:
+            files = [entry.path for entry in entries if entry.is_file()]
+        for path in files:
+            os.unlink(path)
+        count = len(files)
 
         # Remove directory if empty
-        if not any(job_dir.iterdir()):
-            job_dir.rmdir()
+        try:
+            os.rmdir(job_dir)
+        except OSError:
+            pass
+
+        self._forget_job(job_id)
 
         logger.info(f"Deleted {count} export files for job {job_id}")
 
         return count
 
+    async def _get_checksum(self, file_path: Path, file_stat: os.stat_result) -> str:
+        """Return the file's SHA256, hashing it off the event loop only if it changed."""
+        key = str(file_path)
+        checksum = self.cached_checksum(key, file_stat)
+        if checksum is not None:
+            return checksum
+
+        checksum = await asyncio.to_thread(self._calculate_checksum, file_path)
+        self._checksums[key] = (file_stat.st_mtime_ns, file_stat.st_size, checksum)
+        return checksum
+
+    def _forget_job(self, job_id: str) -> None:
+        """Drop cached checksums and the metadata lock for a job."""
+        prefix = str(self.storage_dir / job_id) + os.sep
+        for key in [k for k in self._checksums if k.startswith(prefix)]:
+            del self._checksums[key]
+        self._metadata_locks.pop(job_id, None)
+
     def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum of file."""
         sha256_hash = hashlib.sha256()
 
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
                 sha256_hash.update(byte_block)
 
         return sha256_hash.hexdigest()
@@ -6,12 +6,14 @@ Manages scraping job lifecycle, execution, and state management.
 """
 
 import asyncio
+import os
+import socket
 import sqlite3
 import json
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
+from typing import Optional, List, Dict, Any, Set, Tuple, AsyncIterator
 from collections import defaultdict
 import logging
 import uuid
@@ -25,34 +27,122 @@ from ..models.responses import (
     JobLogEntry
 )
 
+try:
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Prefix of the Redis lists holding IDs of submitted jobs (LPUSH in,
+# BRPOP out); each job store gets its own list, see JobService.queue_key
+JOB_QUEUE_KEY = "scrape:jobs"
+
+# Update types after which a job stream ends
+TERMINAL_UPDATE_TYPES = frozenset(("complete", "error", "cancelled"))
+
+
+class ProgressState:
+    """
+    Live progress of a running job.
+
+    Updated in place on every progress tick; converted to the JobProgress
+    response model only when a job status is requested.
+    """
+
+    __slots__ = ('current_page', 'total_pages', 'percent_complete', 'current_operation')
+
+    def __init__(
+        self,
+        current_page: int = 0,
+        total_pages: int = 0,
+        percent_complete: float = 0.0,
+        current_operation: str = "Processing"
+    ) -> None:
+        self.current_page = current_page
+        self.total_pages = total_pages
+        self.percent_complete = percent_complete
+        self.current_operation = current_operation
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the progress as a plain dictionary."""
+        return {
+            "current_page": self.current_page,
+            "total_pages": self.total_pages,
+            "percent_complete": self.percent_complete,
+            "current_operation": self.current_operation
+        }
+
+    def to_response(self) -> JobProgress:
+        """Build the API response model for this progress."""
+        return JobProgress(**self.as_dict())
+
 
 class JobService:
     """
     Service for managing scraping jobs.
 
     Handles job creation, execution, status tracking, and result storage.
+
+    Job metadata lives in SQLite and is visible to every worker process on
+    the host; live progress and WebSocket subscribers are per process, so
+    a progress stream only sees jobs running in its own worker.
+
+    Jobs run on a fixed pool of long-lived runner tasks fed from a queue,
+    so at most ``concurrency`` scrapes execute at once per process no
+    matter how many requests arrive. With Redis, submitted jobs go to a
+    Redis list instead, which survives restarts and is shared by every
+    worker process using the same job database; each process pulls only as
+    many jobs as it has free runners. A job already pulled is lost if its
+    process dies.
     """
 
-    def __init__(self, db_path: str = ".scraper_jobs.db", storage_dir: str = ".scraper_storage"):
+    def __init__(
+        self,
+        db_path: str = ".scraper_jobs.db",
+        storage_dir: str = ".scraper_storage",
+        concurrency: int = 4
+    ):
         """
         Initialize job service.
 
         Args:
             db_path: SQLite database path for job metadata
             storage_dir: Directory for storing job results
+            concurrency: Number of jobs executed at the same time
         """
         self.db_path = db_path
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        # Job rows live in a per-host SQLite file, so only processes sharing
+        # that file may pull each other's jobs from Redis
+        self.queue_key = f"{JOB_QUEUE_KEY}:{socket.gethostname()}:{os.path.abspath(db_path)}"
 
         # In-memory job progress tracking
-        self.job_progress: Dict[str, Dict] = {}
+        self.job_progress: Dict[str, ProgressState] = {}
         self.job_subscribers: Dict[str, List[asyncio.Queue]] = defaultdict(list)
 
-    async def initialize(self):
-        """Initialize database schema."""
+        # Job runner pool, started by initialize()
+        self._job_queue: Optional[asyncio.Queue] = None
+        self._runners: List[asyncio.Task] = []
+        # Results awaited by run_job(), keyed by job_id
+        self._completions: Dict[str, asyncio.Future] = {}
+
+        # Shared job queue, set by initialize() when Redis is available
+        self.redis = None
+        self._feeder: Optional[asyncio.Task] = None
+        self._feed_slots: Optional[asyncio.Semaphore] = None
+        self._fed_jobs: Set[str] = set()
+
+    async def initialize(self, redis=None):
+        """
+        Initialize database schema and start the job runners.
+
+        Args:
+            redis: Optional Redis client for the shared job queue
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -121,14 +211,130 @@ class JobService:
         conn.commit()
         conn.close()
 
+        self._job_queue = asyncio.Queue()
+        self._runners = [
+            asyncio.create_task(self._run_jobs())
+            for _ in range(self.concurrency)
+        ]
+
+        self.redis = redis
+        if redis is not None:
+            self._feed_slots = asyncio.Semaphore(self.concurrency)
+            self._feeder = asyncio.create_task(self._feed_from_redis())
+
         logger.info("Job service initialized")
 
     async def cleanup(self):
         """Cleanup resources."""
+        # Stop job runners; jobs still queued stay "queued" in the database
+        tasks = self._runners + ([self._feeder] if self._feeder else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._runners.clear()
+        self._feeder = None
+
         # Close any open connections, cleanup subscribers
         self.job_subscribers.clear()
         logger.info("Job service cleanup complete")
 
+    async def enqueue_job(self, job_id: str) -> None:
+        """
+        Queue a job for execution by this process's runner pool.
+
+        Args:
+            job_id: Job identifier
+        """
+        await self._job_queue.put(job_id)
+
+    async def submit_job(self, job_id: str) -> None:
+        """
+        Submit a job for background execution.
+
+        Goes to the shared Redis queue when configured, so any worker
+        process may run it; otherwise to this process's runner pool.
+
+        Args:
+            job_id: Job identifier
+        """
+        if self.redis is not None:
+            try:
+                await self.redis.lpush(self.queue_key, job_id)
+                return
+            except (RedisError, OSError) as e:
+                logger.warning("Redis job queue unavailable, running %s locally: %s", job_id, e)
+
+        await self.enqueue_job(job_id)
+
+    async def _feed_from_redis(self) -> None:
+        """Feeder task: move jobs from Redis to local runners as they free up."""
+        while True:
+            await self._feed_slots.acquire()
+            try:
+                item = await self.redis.brpop(self.queue_key, timeout=5)
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                self._feed_slots.release()
+                logger.warning("Failed to read Redis job queue: %s", e)
+                await asyncio.sleep(1)
+                continue
+
+            if item is None:
+                self._feed_slots.release()
+                continue
+
+            job_id = item[1].decode() if isinstance(item[1], bytes) else item[1]
+            self._fed_jobs.add(job_id)
+            await self.enqueue_job(job_id)
+
+    async def run_job(self, job_id: str, timeout: float) -> Dict[str, Any]:
+        """
+        Queue a job and wait for it to finish.
+
+        The job keeps running if the wait times out, so its status can
+        still be polled.
+
+        Args:
+            job_id: Job identifier
+            timeout: Seconds to wait for completion
+
+        Returns:
+            Job execution result
+
+        Raises:
+            asyncio.TimeoutError: If the job did not finish within timeout
+        """
+        completion = asyncio.get_running_loop().create_future()
+        self._completions[job_id] = completion
+        try:
+            await self.enqueue_job(job_id)
+            return await asyncio.wait_for(asyncio.shield(completion), timeout)
+        finally:
+            self._completions.pop(job_id, None)
+
+    async def _run_jobs(self) -> None:
+        """Runner task: execute queued jobs one at a time, forever."""
+        while True:
+            job_id = await self._job_queue.get()
+            completion = self._completions.get(job_id)
+            try:
+                result = await self.execute_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # execute_job already logged and recorded the failure
+                if completion is not None and not completion.done():
+                    completion.set_exception(e)
+            else:
+                if completion is not None and not completion.done():
+                    completion.set_result(result)
+            finally:
+                self._job_queue.task_done()
+                if job_id in self._fed_jobs:
+                    self._fed_jobs.discard(job_id)
+                    self._feed_slots.release()
+
     async def create_job(
         self,
         url: str,
@@ -241,13 +447,7 @@ class JobService:
         # Get progress if running
         progress = None
         if status == JobStatusEnum.RUNNING.value and job_id in self.job_progress:
-            prog_data = self.job_progress[job_id]
-            progress = JobProgress(
-                current_page=prog_data.get("current_page", 0),
-                total_pages=prog_data.get("total_pages", 0),
-                percent_complete=prog_data.get("percent_complete", 0.0),
-                current_operation=prog_data.get("current_operation", "Processing")
-            )
+            progress = self.job_progress[job_id].to_response()
 
         # Get exports
         exports = await self._get_job_exports(job_id)
@@ -339,21 +539,31 @@ class JobService:
         """
         Execute scraping job (to be called in background).
 
+        The job is claimed by moving it from queued to running in one
+        update, so a job cancelled while it waited in the queue is skipped
+        and a cancellation during the run is not overwritten.
+
         Args:
             job_id: Job identifier
 
         Returns:
-            Job execution result
+            Job execution result; its status is the job's current status if
+            the job was no longer queued or was cancelled while running
         """
         try:
-            # Update status to running
-            await self._update_job_status(job_id, JobStatusEnum.RUNNING)
+            if not await self._update_job_status(
+                job_id, JobStatusEnum.RUNNING, expected_status=JobStatusEnum.QUEUED
+            ):
+                job = await self.get_job(job_id)
+                if not job:
+                    raise ValueError(f"Job {job_id} not found")
+                logger.info(f"Skipping job {job_id}: status is {job.status.value}")
+                return {"status": job.status.value, "job_id": job_id}
+
             await self._log_job(job_id, "info", "Job started")
 
             # Get job details
             job = await self.get_job(job_id)
-            if not job:
-                raise ValueError(f"Job {job_id} not found")
 
             # TODO: Implement actual scraping logic using ScraperService
             # For now, simulate execution
@@ -366,15 +576,20 @@ class JobService:
             await self._update_progress(job_id, 100, 100, 100.0, "Generating exports")
             await asyncio.sleep(1)
 
-            # Mark as completed
-            await self._update_job_status(job_id, JobStatusEnum.COMPLETED)
+            # Mark as completed unless cancelled in the meantime
+            if not await self._update_job_status(
+                job_id, JobStatusEnum.COMPLETED, expected_status=JobStatusEnum.RUNNING
+            ):
+                return {"status": JobStatusEnum.CANCELLED.value, "job_id": job_id}
             await self._log_job(job_id, "info", "Job completed successfully")
 
             return {"status": "completed", "job_id": job_id}
 
         except Exception as e:
             logger.error(f"Job {job_id} failed: {e}", exc_info=True)
-            await self._update_job_status(job_id, JobStatusEnum.FAILED, str(e))
+            await self._update_job_status(
+                job_id, JobStatusEnum.FAILED, str(e), expected_status=JobStatusEnum.RUNNING
+            )
             await self._log_job(job_id, "error", f"Job failed: {e}")
             raise
 
@@ -419,18 +634,32 @@ class JobService:
         )
 
     async def stream_job_updates(self, job_id: str) -> AsyncIterator[Dict]:
-        """Stream real-time job updates via async iterator."""
+        """
+        Stream real-time job updates via async iterator.
+
+        Updates that pile up while the consumer is busy are drained together,
+        and consecutive progress updates among them are collapsed into the
+        latest one, so a slow WebSocket client does not replay every tick.
+        """
         queue = asyncio.Queue()
         self.job_subscribers[job_id].append(queue)
 
         try:
             while True:
-                update = await queue.get()
-                yield update
+                pending = [await queue.get()]
+                while not queue.empty():
+                    update = queue.get_nowait()
+                    if update.get("type") == "progress" and pending[-1].get("type") == "progress":
+                        pending[-1] = update
+                    else:
+                        pending.append(update)
+
+                for update in pending:
+                    yield update
 
-                # Stop if job completed
-                if update.get("type") in ["complete", "error", "cancelled"]:
-                    break
+                    # Stop if job completed
+                    if update.get("type") in TERMINAL_UPDATE_TYPES:
+                        return
 
         finally:
             self.job_subscribers[job_id].remove(queue)
@@ -517,41 +746,67 @@ class JobService:
         self,
         job_id: str,
         status: JobStatusEnum,
-        error_message: Optional[str] = None
-    ):
-        """Update job status in database."""
+        error_message: Optional[str] = None,
+        expected_status: Optional[JobStatusEnum] = None
+    ) -> bool:
+        """
+        Update job status in database.
+
+        Args:
+            job_id: Job identifier
+            status: New status
+            error_message: Error recorded with a terminal status
+            expected_status: Only update if the job currently has this status
+
+        Returns:
+            True if the job row was updated
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
         timestamp = time.time()
 
         if status == JobStatusEnum.RUNNING:
-            cursor.execute('''
+            query = '''
                 UPDATE jobs
                 SET status = ?, started_at = ?
                 WHERE job_id = ?
-            ''', (status.value, timestamp, job_id))
+            '''
+            params = [status.value, timestamp, job_id]
         elif status in [JobStatusEnum.COMPLETED, JobStatusEnum.FAILED, JobStatusEnum.CANCELLED]:
-            cursor.execute('''
+            query = '''
                 UPDATE jobs
                 SET status = ?, completed_at = ?, error_message = ?
                 WHERE job_id = ?
-            ''', (status.value, timestamp, error_message, job_id))
+            '''
+            params = [status.value, timestamp, error_message, job_id]
         else:
-            cursor.execute('''
+            query = '''
                 UPDATE jobs
                 SET status = ?
                 WHERE job_id = ?
-            ''', (status.value, job_id))
+            '''
+            params = [status.value, job_id]
+
+        if expected_status is not None:
+            query += 'AND status = ?'
+            params.append(expected_status.value)
+
+        cursor.execute(query, params)
+        updated = cursor.rowcount > 0
 
         conn.commit()
         conn.close()
 
+        if not updated:
+            return False
+
         # Notify subscribers
         await self._notify_subscribers(job_id, {
             "type": "status",
             "data": {"job_id": job_id, "status": status.value}
         })
+        return True
 
     async def _update_progress(
         self,
@@ -562,23 +817,18 @@ class JobService:
         operation: str
     ):
         """Update job progress."""
-        self.job_progress[job_id] = {
-            "current_page": current_page,
-            "total_pages": total_pages,
-            "percent_complete": percent,
-            "current_operation": operation
-        }
+        state = self.job_progress.get(job_id)
+        if state is None:
+            state = self.job_progress[job_id] = ProgressState()
+        state.current_page = current_page
+        state.total_pages = total_pages
+        state.percent_complete = percent
+        state.current_operation = operation
 
         # Notify subscribers
         await self._notify_subscribers(job_id, {
             "type": "progress",
-            "data": {
-                "job_id": job_id,
-                "current_page": current_page,
-                "total_pages": total_pages,
-                "percent_complete": percent,
-                "current_operation": operation
-            }
+            "data": {"job_id": job_id, **state.as_dict()}
         })
 
     async def _log_job(
@@ -7,20 +7,53 @@ Core scraping logic and integration with scraper module.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Outbound connection pool shared by URL validation probes
+MAX_PROBE_CONNECTIONS = 100
+MAX_PROBE_CONNECTIONS_PER_HOST = 10
+
+# Validations allowed to probe remote sites at the same time
+MAX_CONCURRENT_VALIDATIONS = 32
+
 
 class ScraperService:
     """
     Service for executing scraping operations.
 
     Integrates with the core scraper module and provides async interface.
+
+    URL probes share one pooled HTTP session, so repeated validations of
+    the same site reuse keep-alive connections, and at most
+    MAX_CONCURRENT_VALIDATIONS of them run at once.
     """
 
+    def __init__(self):
+        """Initialize scraper service."""
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._validation_slots = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+
+    async def initialize(self):
+        """Open the shared HTTP session."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=MAX_PROBE_CONNECTIONS,
+                    limit_per_host=MAX_PROBE_CONNECTIONS_PER_HOST
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+
+    async def cleanup(self):
+        """Close the shared HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
     async def validate_url(self, url: str, options: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate URL accessibility and scraping options.
@@ -37,10 +70,12 @@ class ScraperService:
         valid = True
 
         try:
+            await self.initialize()
+
             # Check URL accessibility
-            async with aiohttp.ClientSession() as session:
+            async with self._validation_slots:
                 try:
-                    async with session.head(url, timeout=aiohttp.ClientTimeout(total=10), allow_redirects=True) as response:
+                    async with self.session.head(url, allow_redirects=True) as response:
                         if response.status >= 400:
                             valid = False
                             warnings.append(f"URL returned status code {response.status}")
@@ -51,6 +51,9 @@ class Config:
             'max_retries': 3,
             'backoff_factor': 2.0,
         },
+        'github': {
+            'max_concurrency': 8,  # Concurrent file downloads
+        },
         'robots': {
             'enabled': True,
             'respect_crawl_delay': True,
@@ -1,5 +1,6 @@
 """HTML export converter for static site generation."""
 
+import asyncio
 import time
 import json
 import shutil
@@ -79,29 +80,30 @@ class HTMLExportConverter(ExportConverter):
             (site_dir / 'pages').mkdir(exist_ok=True)
             (site_dir / 'assets').mkdir(exist_ok=True)
 
+            # Rendered files are collected here and written in one batch
+            files: Dict[Path, bytes] = {}
+
             # Copy/create static assets
-            self._create_assets(site_dir / 'assets', options)
+            self._create_assets(site_dir / 'assets', options, files)
 
             # Generate index page
-            self._generate_index(pages, site_dir, options)
+            self._generate_index(pages, site_dir, options, files)
 
             # Generate individual pages
             page_files = []
             for page in pages:
-                filename = self._generate_page(page, site_dir, pages, options)
+                filename = self._generate_page(page, site_dir, pages, options, files)
                 page_files.append(filename)
 
             # Generate search index
-            self._generate_search_index(pages, site_dir, page_files)
+            self._generate_search_index(pages, site_dir, page_files, files)
+
+            await asyncio.to_thread(self._write_files, files)
 
             duration = time.time() - start_time
 
             # Calculate total size
-            total_size = sum(
-                f.stat().st_size
-                for f in site_dir.rglob('*')
-                if f.is_file()
-            )
+            total_size = sum(len(data) for data in files.values())
 
             return ExportResult(
                 format=self.format_name,
@@ -125,11 +127,18 @@ class HTMLExportConverter(ExportConverter):
                 error=str(e)
             )
 
+    @staticmethod
+    def _write_files(files: Dict[Path, bytes]):
+        """Write all rendered files in a single pass off the event loop."""
+        for path, data in files.items():
+            path.write_bytes(data)
+
     def _generate_index(
         self,
         pages: List[PageResult],
         site_dir: Path,
-        options: ExportOptions
+        options: ExportOptions,
+        files: Dict[Path, bytes]
     ):
         """Generate index.html with navigation."""
         try:
@@ -147,14 +156,15 @@ class HTMLExportConverter(ExportConverter):
             toc=self._generate_toc(pages) if options.include_toc else None
         )
 
-        (site_dir / 'index.html').write_text(html, encoding='utf-8')
+        files[site_dir / 'index.html'] = html.encode('utf-8')
 
     def _generate_page(
         self,
         page: PageResult,
         site_dir: Path,
         all_pages: List[PageResult],
-        options: ExportOptions
+        options: ExportOptions,
+        files: Dict[Path, bytes]
     ) -> str:
         """Generate individual page HTML."""
         try:
@@ -184,7 +194,7 @@ class HTMLExportConverter(ExportConverter):
 
         # Sanitize filename
         filename = self._sanitize_filename(page.title) + '.html'
-        (site_dir / 'pages' / filename).write_text(html, encoding='utf-8')
+        files[site_dir / 'pages' / filename] = html.encode('utf-8')
 
         return filename
 
@@ -192,7 +202,8 @@ class HTMLExportConverter(ExportConverter):
         self,
         pages: List[PageResult],
         site_dir: Path,
-        page_files: List[str]
+        page_files: List[str],
+        files: Dict[Path, bytes]
     ):
         """Generate search index for client-side search."""
         search_data = []
@@ -209,10 +220,9 @@ class HTMLExportConverter(ExportConverter):
                 'headings': [h.get_text(strip=True) for h in soup.find_all(['h1', 'h2', 'h3'])]
             })
 
-        (site_dir / 'assets' / 'search-index.json').write_text(
-            json.dumps(search_data, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
+        files[site_dir / 'assets' / 'search-index.json'] = json.dumps(
+            search_data, indent=2, ensure_ascii=False
+        ).encode('utf-8')
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text."""
@@ -259,7 +269,12 @@ class HTMLExportConverter(ExportConverter):
 
         return toc
 
-    def _create_assets(self, assets_dir: Path, options: ExportOptions):
+    def _create_assets(
+        self,
+        assets_dir: Path,
+        options: ExportOptions,
+        files: Dict[Path, bytes]
+    ):
         """Create static assets (CSS, JS)."""
         # Create CSS
         css_content = self._get_default_css()
@@ -268,10 +283,10 @@ class HTMLExportConverter(ExportConverter):
             if custom_css_path.exists():
                 css_content += '\n\n/* Custom CSS */\n' + custom_css_path.read_text()
 
-        (assets_dir / 'style.css').write_text(css_content, encoding='utf-8')
+        files[assets_dir / 'style.css'] = css_content.encode('utf-8')
 
         # Create JavaScript for search
-        (assets_dir / 'search.js').write_text(self._get_search_js(), encoding='utf-8')
+        files[assets_dir / 'search.js'] = self._get_search_js().encode('utf-8')
 
     def _get_default_css(self) -> str:
         """Get default CSS."""
@@ -11,6 +11,12 @@ from .base import ExportConverter, ExportOptions, ExportResult, PageResult
 from .content_parser import ContentParser
 from .api_detector import APIDetector
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,8 +134,7 @@ class JSONExportConverter(ExportConverter):
             }
             
             # Write JSON file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            output_path.write_bytes(self._dumps(data))
 
             duration = time.time() - start_time
 
@@ -156,6 +161,20 @@ class JSONExportConverter(ExportConverter):
                 error=str(e)
             )
 
+    @staticmethod
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        """Serialize export data to indented UTF-8 JSON bytes."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                data,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_DATACLASS
+                    | orjson.OPT_NON_STR_KEYS
+                )
+            )
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
     def _collect_languages(self, sections: List[Dict[str, Any]]) -> set:
         """Collect all programming languages used in code examples."""
         languages = set()
@@ -1,11 +1,14 @@
 """Export orchestrator for managing multiple format exports."""
 
 import asyncio
+import atexit
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Type
 
-from .base import ExportOptions, ExportResult, PageResult
+from .base import ExportConverter, ExportOptions, ExportResult, PageResult
 from .pdf_exporter import PDFExportConverter
 from .epub_exporter import EPUBExportConverter
 from .json_exporter import JSONExportConverter
@@ -13,6 +16,50 @@ from .html_exporter import HTMLExportConverter
 
 logger = logging.getLogger(__name__)
 
+# Converters built inside pool worker processes, reused across exports
+_worker_converters: Dict[type, ExportConverter] = {}
+
+# Worker pools shared by every orchestrator, keyed by max_workers, so
+# callers that build an orchestrator per export reuse warm processes
+_executors: Dict[Optional[int], ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Get the shared process pool for ``max_workers``, creating it on first use."""
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = _executors[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers
+            )
+        return executor
+
+
+def shutdown_executors():
+    """Shut down the worker processes used for parallel exports."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_executors)
+
+
+def _run_export(
+    converter_cls: Type[ExportConverter],
+    pages: List[PageResult],
+    output_path: Path,
+    options: ExportOptions
+) -> ExportResult:
+    """Run a converter to completion inside a pool worker process."""
+    converter = _worker_converters.get(converter_cls)
+    if converter is None:
+        converter = _worker_converters[converter_cls] = converter_cls()
+    return asyncio.run(converter.convert(pages, output_path, options))
+
 
 class ExportOrchestrator:
     """
@@ -23,11 +70,23 @@ class ExportOrchestrator:
     - Error handling per format
     - Progress tracking
     - Result aggregation
+
+    Converters are CPU-bound, so when several formats are requested each
+    one runs in a separate worker process rather than sharing the event
+    loop thread. The process pool is shared across orchestrators and shut
+    down at interpreter exit.
     """
 
-    def __init__(self):
-        """Initialize orchestrator with all available converters."""
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize orchestrator with all available converters.
+
+        Args:
+            max_workers: Worker processes for multi-format exports
+                (defaults to the number of CPUs)
+        """
         self.converters = {}
+        self.max_workers = max_workers
 
         # Register converters with error handling
         try:
@@ -87,6 +146,9 @@ class ExportOrchestrator:
             logger.error("No valid formats specified")
             return {}
 
+        # A single format gains nothing from a worker process
+        use_process_pool = len(formats) > 1
+
         # Create tasks for each format
         tasks = []
         for format_name in formats:
@@ -113,7 +175,8 @@ class ExportOrchestrator:
                     format_name,
                     pages,
                     output_path,
-                    format_options
+                    format_options,
+                    use_process_pool=use_process_pool
                 )
             )
             tasks.append((format_name, task))
@@ -140,10 +203,21 @@ class ExportOrchestrator:
         format_name: str,
         pages: List[PageResult],
         output_path: Path,
-        options: ExportOptions
+        options: ExportOptions,
+        use_process_pool: bool = False
     ) -> ExportResult:
         """Execute export with error handling."""
         try:
+            if use_process_pool:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    _get_executor(self.max_workers),
+                    _run_export,
+                    type(converter),
+                    pages,
+                    output_path,
+                    options
+                )
             return await converter.convert(pages, output_path, options)
         except Exception as e:
             logger.error(f"Export {format_name} failed: {e}", exc_info=True)
@@ -30,6 +30,7 @@ Usage:
 import re
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
@@ -49,6 +50,10 @@ from .user_agents import get_user_agent, UserAgents
 logger = get_logger(__name__)
 
 
+# Default cap on concurrent file downloads, to stay clear of GitHub's
+# secondary rate limits
+DEFAULT_MAX_CONCURRENCY = 8
+
 # Documentation file extensions to include
 DOC_EXTENSIONS = {
     '.md', '.markdown',      # Markdown
@@ -629,73 +634,86 @@ def scrape_github_repo(
         files_processed = 0
         files_failed = 0
 
-        for idx, file_item in enumerate(files_to_process):
-            filepath = file_item['path']
-            
-            # Notify progress callback about current file
-            if progress_callback:
-                progress_callback({
-                    'status': 'processing',
-                    'current_file': filepath,
-                    'current_index': idx + 1,
-                    'total_files': total_files,
-                    'files_processed': files_processed,
-                    'files_failed': files_failed
-                })
-
-            try:
-                logger.info(f"Processing: {filepath}")
-
-                # Fetch file content
-                content = get_file_content(owner, repo, branch, filepath, config, session)
+        def fetch_file(filepath: str) -> str:
+            logger.info(f"Processing: {filepath}")
 
-                # Convert relative links to absolute
-                content = convert_relative_links(content, owner, repo, branch, filepath)
+            # Fetch file content
+            content = get_file_content(owner, repo, branch, filepath, config, session)
 
-                # Add to documentation
-                file_title = Path(filepath).name
-                github_url = f"https://github.com/{owner}/{repo}/blob/{branch}/{filepath}"
+            # Convert relative links to absolute
+            return convert_relative_links(content, owner, repo, branch, filepath)
 
-                full_documentation += f"## {file_title}\n\n"
-                full_documentation += f"**Path:** `{filepath}`\n"
-                full_documentation += f"**URL:** {github_url}\n\n"
-                full_documentation += content
-                full_documentation += "\n\n---\n\n"
-
-                files_processed += 1
-                
-                # Notify success
-                if progress_callback:
-                    progress_callback({
-                        'status': 'success',
-                        'file': filepath,
-                        'files_processed': files_processed
-                    })
+        # Downloads run concurrently, bounded by the pool size; results are
+        # consumed in order so the output keeps the repository ordering
+        max_concurrency = config.get('github.max_concurrency', DEFAULT_MAX_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(fetch_file, file_item['path'])
+                for file_item in files_to_process
+            ]
 
-                # Be polite to GitHub API
-                time.sleep(0.5)
+            for idx, (file_item, future) in enumerate(zip(files_to_process, futures)):
+                filepath = file_item['path']
 
-            except (NetworkException, ContentParsingException) as e:
-                logger.error(f"Failed to process {filepath}: {e}")
-                files_failed += 1
-                
-                # Notify error
+                # Notify progress callback about current file
                 if progress_callback:
                     progress_callback({
-                        'status': 'error',
-                        'file': filepath,
-                        'error': str(e),
+                        'status': 'processing',
+                        'current_file': filepath,
+                        'current_index': idx + 1,
+                        'total_files': total_files,
+                        'files_processed': files_processed,
                         'files_failed': files_failed
                     })
 
-            except RateLimitException as e:
-                logger.warning(f"Rate limit hit, stopping: {e}")
-                if progress_callback:
-                    progress_callback({
-                        'status': 'rate_limit',
-                        'error': str(e)
-                    })
-                break
+                try:
+                    content = future.result()
+
+                    # Add to documentation
+                    file_title = Path(filepath).name
+                    github_url = f"https://github.com/{owner}/{repo}/blob/{branch}/{filepath}"
+
+                    full_documentation += f"## {file_title}\n\n"
+                    full_documentation += f"**Path:** `{filepath}`\n"
+                    full_documentation += f"**URL:** {github_url}\n\n"
+                    full_documentation += content
+                    full_documentation += "\n\n---\n\n"
+
+                    files_processed += 1
+
+                    # Notify success
+                    if progress_callback:
+                        progress_callback({
+                            'status': 'success',
+                            'file': filepath,
+                            'files_processed': files_processed
+                        })
+
+                except (NetworkException, ContentParsingException) as e:
+                    logger.error(f"Failed to process {filepath}: {e}")
+                    files_failed += 1
+
+                    # Notify error
+                    if progress_callback:
+                        progress_callback({
+                            'status': 'error',
+                            'file': filepath,
+                            'error': str(e),
+                            'files_failed': files_failed
+                        })
+
+                except RateLimitException as e:
+                    logger.warning(f"Rate limit hit, stopping: {e}")
+                    if progress_callback:
+                        progress_callback({
+                            'status': 'rate_limit',
+                            'error': str(e)
+                        })
+
+                    # Drop downloads that have not started yet
+                    for pending in futures[idx + 1:]:
+                        pending.cancel()
+                    break
 
         # Generate output filename
         output_filename = f"{owner}_{repo}_{branch}"
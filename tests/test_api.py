@@ -5,11 +5,16 @@ API Integration Tests
 Tests for FastAPI endpoints.
 """
 
+import os
 import pytest
-from httpx import AsyncClient
+import time
+from email.utils import formatdate
+from httpx import ASGITransport, AsyncClient
 from fastapi.testclient import TestClient
 
 from src.scrape_api_docs.api.main import app
+from src.scrape_api_docs.api.routers.exports import ZEROCOPY_EXTENSION, SendfileResponse
+from src.scrape_api_docs.api.services.export_service import ExportService
 
 
 # Synchronous tests using TestClient
@@ -263,5 +268,127 @@ async def test_metrics_endpoint():
         assert "TYPE" in content
 
 
+# Export download tests
+@pytest.fixture
+def export_url(tmp_path, monkeypatch):
+    """Serve exports from a temporary storage directory holding one file."""
+    monkeypatch.setattr(
+        app.state, "export_service", ExportService(storage_dir=str(tmp_path)), raising=False
+    )
+    job_dir = tmp_path / "job_test"
+    job_dir.mkdir()
+    export_path = job_dir / "output.md"
+    export_path.write_text("# Docs\n")
+    # Modified an hour ago, so second-granularity dates compare cleanly
+    mtime = time.time() - 3600
+    os.utime(export_path, (mtime, mtime))
+    return "/api/v1/exports/job_test/output.md"
+
+
+def export_client():
+    """Client with its own address, so earlier tests' rate limit does not apply."""
+    transport = ASGITransport(app=app, client=("203.0.113.7", 50000))
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.fixture
+def east_of_utc(monkeypatch):
+    """Run with a local timezone ahead of UTC."""
+    monkeypatch.setenv("TZ", "JST-9")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.asyncio
+async def test_download_export(export_url):
+    """Test downloading an export sends the file with cache validators."""
+    async with export_client() as ac:
+        response = await ac.get(export_url)
+
+    assert response.status_code == 200
+    assert response.text == "# Docs\n"
+    assert response.headers["content-type"].startswith("text/markdown")
+    assert "etag" in response.headers
+    assert "last-modified" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_download_export_if_none_match(export_url):
+    """Test a matching If-None-Match gets 304 without the body."""
+    async with export_client() as ac:
+        etag = (await ac.get(export_url)).headers["etag"]
+
+        response = await ac.get(export_url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = await ac.get(export_url, headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_download_export_if_modified_since(export_url):
+    """Test If-Modified-Since at or after the file's mtime gets 304."""
+    async with export_client() as ac:
+        last_modified = (await ac.get(export_url)).headers["last-modified"]
+
+        response = await ac.get(export_url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+        earlier = formatdate(time.time() - 7200, usegmt=True)
+        response = await ac.get(export_url, headers={"If-Modified-Since": earlier})
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_download_export_if_modified_since_minus_zero(export_url, east_of_utc):
+    """Test a "-0000" If-Modified-Since date is read as UTC, not local time."""
+    since = formatdate(time.time()).replace("+0000", "-0000")
+
+    async with export_client() as ac:
+        response = await ac.get(export_url, headers={"If-Modified-Since": since})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_download_export_zerocopysend(tmp_path):
+    """Test servers advertising zerocopysend are handed the open file."""
+    export_path = tmp_path / "output.md"
+    export_path.write_text("# Docs\n")
+    response = SendfileResponse(path=str(export_path), media_type="text/markdown")
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [],
+        "extensions": {ZEROCOPY_EXTENSION: {}}
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        if message["type"] == ZEROCOPY_EXTENSION:
+            message = {**message, "file": message["file"].read()}
+        messages.append(message)
+
+    await response(scope, receive, send)
+
+    assert messages[0]["status"] == 200
+    assert messages[1] == {"type": ZEROCOPY_EXTENSION, "file": b"# Docs\n", "more_body": False}
+    assert len(messages) == 2
+
+    # Gzip-capable clients get a regular body GZipMiddleware can compress
+    messages.clear()
+    scope["headers"] = [(b"accept-encoding", b"gzip")]
+    await response(scope, receive, send)
+
+    assert all(message["type"] != ZEROCOPY_EXTENSION for message in messages)
+    assert b"".join(message.get("body", b"") for message in messages[1:]) == b"# Docs\n"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+"""
+Unit tests for the authentication manager's credential file handling.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add auth example to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'examples' / 'auth'))
+
+import auth_manager
+from auth_manager import AuthManager, AuthType
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason="POSIX file modes")
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Credential config path under a permissive umask."""
+    old_umask = os.umask(0o022)
+    yield tmp_path / 'auth.json'
+    os.umask(old_umask)
+
+
+def file_mode(path: Path) -> int:
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+@pytest.mark.unit
+class TestSaveCredentials:
+    """Test credential file writes."""
+
+    def test_new_file_is_owner_only(self, config_file):
+        """Test a newly created credentials file is not world-readable."""
+        auth = AuthManager(config_file=config_file)
+        auth.add_credential('api.example.com', AuthType.BEARER, token='secret')
+
+        assert file_mode(config_file) == 0o600
+
+    def test_save_keeps_existing_mode(self, config_file):
+        """Test saving over an existing file keeps the mode set on it."""
+        config_file.write_text('{}')
+        os.chmod(config_file, 0o600)
+
+        auth = AuthManager(config_file=config_file)
+        auth.add_credential('api.example.com', AuthType.BEARER, token='secret')
+        assert file_mode(config_file) == 0o600
+
+        os.chmod(config_file, 0o640)
+        auth.add_credential('docs.example.com', AuthType.BEARER, token='other')
+        assert file_mode(config_file) == 0o640
+
+    def test_failed_save_removes_temp_file(self, config_file):
+        """Test a failed write leaves no secrets behind in the temp file."""
+        auth = AuthManager(config_file=config_file)
+        dump = 'dumps' if auth_manager.ORJSON_AVAILABLE else 'dump'
+        target = auth_manager.orjson if auth_manager.ORJSON_AVAILABLE else auth_manager.json
+
+        with patch.object(target, dump, side_effect=ValueError("boom")):
+            auth.add_credential('api.example.com', AuthType.BEARER, token='secret')
+
+        assert not config_file.exists()
+        assert list(config_file.parent.iterdir()) == []
@@ -0,0 +1,220 @@
+"""Unit tests for the API job service."""
+
+import asyncio
+import pytest
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from scrape_api_docs.api.models.responses import JobStatusEnum
+from scrape_api_docs.api.services.job_service import JobService
+
+
+@pytest.fixture
+def job_service(tmp_path):
+    """Create a job service backed by a temporary database."""
+    return JobService(
+        db_path=str(tmp_path / "jobs.db"),
+        storage_dir=str(tmp_path / "storage"),
+        concurrency=2
+    )
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis list commands the job queue uses."""
+
+    def __init__(self):
+        self.lists = defaultdict(list)
+        self.waiters = defaultdict(list)
+
+    async def lpush(self, key, value):
+        # Hand the value to the longest-blocked BRPOP, like Redis does
+        for waiter in self.waiters.pop(key, []):
+            if not waiter.done():
+                waiter.set_result((key.encode(), value.encode()))
+                return 1
+        self.lists[key].insert(0, value.encode())
+        return len(self.lists[key])
+
+    async def brpop(self, key, timeout=0):
+        if self.lists[key]:
+            return key.encode(), self.lists[key].pop()
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[key].append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class DownRedis:
+    """Redis client whose connection is gone."""
+
+    async def lpush(self, key, value):
+        raise ConnectionError("Connection refused")
+
+
+def record_executions(service, executed):
+    """Replace execute_job with a stub recording (db_path, job_id) pairs."""
+    async def execute_job(job_id):
+        executed.append((service.db_path, job_id))
+        return {"status": "completed", "job_id": job_id}
+
+    service.execute_job = execute_job
+
+
+@asynccontextmanager
+async def running(service, redis=None):
+    """Run the service's job runners for the duration of the block."""
+    await service.initialize(redis=redis)
+    try:
+        yield service
+    finally:
+        await service.cleanup()
+
+
+async def create_job(service):
+    """Create a job with default options and return its ID."""
+    job = await service.create_job(
+        url="https://example.com/docs",
+        options={"max_depth": 1},
+        export_formats=["markdown"]
+    )
+    return job.job_id
+
+
+class TestJobRunners:
+    """Test the job runner pool."""
+
+    @pytest.mark.asyncio
+    async def test_runner_pool_limits_concurrency(self, job_service):
+        """Test no more than ``concurrency`` jobs execute at once."""
+        active = 0
+        peak = 0
+        finished = []
+
+        async def execute_job(job_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            finished.append(job_id)
+            return {"status": "completed", "job_id": job_id}
+
+        job_service.execute_job = execute_job
+        async with running(job_service):
+            for i in range(5):
+                await job_service.submit_job(f"job_{i}")
+            await asyncio.wait_for(job_service._job_queue.join(), 1)
+
+        assert sorted(finished) == [f"job_{i}" for i in range(5)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_job_timeout_leaves_job_running(self, job_service):
+        """Test run_job gives up waiting but the job still finishes."""
+        release = asyncio.Event()
+        finished = []
+
+        async def execute_job(job_id):
+            await release.wait()
+            finished.append(job_id)
+            return {"status": "completed", "job_id": job_id}
+
+        job_service.execute_job = execute_job
+        async with running(job_service):
+            with pytest.raises(asyncio.TimeoutError):
+                await job_service.run_job("job_slow", timeout=0.05)
+
+            release.set()
+            await asyncio.wait_for(job_service._job_queue.join(), 1)
+
+        assert finished == ["job_slow"]
+        assert job_service._completions == {}
+
+    @pytest.mark.asyncio
+    async def test_submit_job_falls_back_when_redis_down(self, job_service):
+        """Test jobs run locally when the Redis queue cannot be reached."""
+        executed = []
+        record_executions(job_service, executed)
+
+        async with running(job_service):
+            job_service.redis = DownRedis()
+            await job_service.submit_job("job_local")
+            await asyncio.wait_for(job_service._job_queue.join(), 1)
+
+        assert executed == [(job_service.db_path, "job_local")]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_while_queued_is_skipped(self, job_service):
+        """Test a job cancelled before a runner claims it never runs."""
+        async with running(job_service):
+            job_id = await create_job(job_service)
+            await job_service.cancel_job(job_id)
+
+            result = await job_service.run_job(job_id, timeout=1)
+
+            assert result == {"status": "cancelled", "job_id": job_id}
+            job = await job_service.get_job(job_id)
+            assert job.status == JobStatusEnum.CANCELLED
+            assert job.started_at is None
+
+    @pytest.mark.asyncio
+    async def test_redis_queue_is_scoped_to_job_store(self, job_service, tmp_path):
+        """Test a process with another job database never pulls foreign job IDs."""
+        other = JobService(
+            db_path=str(tmp_path / "other.db"),
+            storage_dir=str(tmp_path / "storage"),
+            concurrency=2
+        )
+        redis = FakeRedis()
+        executed = []
+        record_executions(job_service, executed)
+        record_executions(other, executed)
+
+        # The other service starts first, so it is first in line to BRPOP
+        async with running(other, redis):
+            await asyncio.sleep(0.01)
+            async with running(job_service, redis):
+                job_id = await create_job(job_service)
+                await job_service.submit_job(job_id)
+                for _ in range(100):
+                    if executed:
+                        break
+                    await asyncio.sleep(0.01)
+
+        assert executed == [(job_service.db_path, job_id)]
+        assert job_service.queue_key != other.queue_key
+
+
+class TestJobUpdates:
+    """Test job update streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_coalesces_pending_progress(self, job_service):
+        """Test progress updates that pile up are collapsed into the latest."""
+        updates = job_service.stream_job_updates("job_stream")
+        first = asyncio.ensure_future(updates.__anext__())
+        await asyncio.sleep(0)
+
+        for update in (
+            {"type": "status", "data": {"status": "running"}},
+            {"type": "progress", "data": {"current_page": 1}},
+            {"type": "progress", "data": {"current_page": 2}},
+            {"type": "log", "data": {"message": "halfway"}},
+            {"type": "progress", "data": {"current_page": 3}},
+            {"type": "progress", "data": {"current_page": 4}},
+            {"type": "complete", "data": {}},
+        ):
+            await job_service._notify_subscribers("job_stream", update)
+
+        received = [await first] + [update async for update in updates]
+
+        assert [(u["type"], u["data"].get("current_page")) for u in received] == [
+            ("status", None),
+            ("progress", 2),
+            ("log", None),
+            ("progress", 4),
+            ("complete", None),
+        ]
+        assert job_service.job_subscribers["job_stream"] == []
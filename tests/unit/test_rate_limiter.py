@@ -10,17 +10,28 @@ Tests cover:
 - Rate limit statistics
 """
 
+import asyncio
 import pytest
 import time
 import sys
+from email.utils import formatdate
 from unittest.mock import Mock, patch, MagicMock
 
 # Add rate-limiting example to path
 sys.path.insert(0, '/home/ruhroh/scrape-api-docs/examples/rate-limiting')
 
-from rate_limiter import TokenBucket, RateLimiter, rate_limited_get
+from rate_limiter import TokenBucket, RateLimiter, parse_retry_after, rate_limited_get
 
 
+@pytest.fixture
+def east_of_utc(monkeypatch):
+    """Run with a local timezone ahead of UTC."""
+    monkeypatch.setenv('TZ', 'JST-9')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
 @pytest.mark.unit
 class TestTokenBucket:
     """Test suite for TokenBucket algorithm."""
@@ -169,16 +180,74 @@ class TestRateLimiter:
         assert bucket1 is bucket3
         assert bucket1 is not bucket2
 
+    def test_acquire(self):
+        """Test acquire returns the time waited."""
+        limiter = RateLimiter(requests_per_second=100.0)  # Fast for testing
+
+        url = 'https://example.com/page1'
+
+        waited = limiter.acquire(url)
+        assert waited >= 0.0
+
     def test_acquire_context_manager(self):
-        """Test acquire context manager usage."""
+        """Test acquire_cm context manager usage."""
         limiter = RateLimiter(requests_per_second=100.0)  # Fast for testing
 
         url = 'https://example.com/page1'
 
-        with limiter.acquire(url) as waited:
+        with limiter.acquire_cm(url) as waited:
             # Should succeed
             assert waited >= 0.0
 
+    def test_acquire_async(self):
+        """Test async acquire waits for refill without blocking the loop."""
+        limiter = RateLimiter(requests_per_second=10.0, burst_size=1)
+        url = 'https://example.com/page'
+
+        async def run():
+            waits = []
+            for _ in range(2):
+                async with limiter.acquire_async(url) as waited:
+                    waits.append(waited)
+            return waits
+
+        first, second = asyncio.run(run())
+
+        assert first < 0.05  # Bucket starts full
+        assert 0.05 < second < 0.2  # Waited ~0.1s for refill
+
+    def test_acquire_async_across_event_loops(self):
+        """Test async buckets keep working after the first loop closes."""
+        limiter = RateLimiter(requests_per_second=10.0, burst_size=1)
+        url = 'https://example.com/page'
+
+        async def run():
+            waits = []
+            for _ in range(2):
+                async with limiter.acquire_async(url) as waited:
+                    waits.append(waited)
+            return waits
+
+        first_loop = asyncio.run(run())
+        second_loop = asyncio.run(run())
+
+        # Both loops had to wait on the same bucket
+        assert 0.05 < first_loop[1] < 0.2
+        assert 0.05 < max(second_loop) < 0.2
+
+    def test_acquire_batch(self):
+        """Test reserving several tokens in one acquire."""
+        limiter = RateLimiter(requests_per_second=10.0, burst_size=5)
+        url = 'https://example.com/page'
+
+        limiter.acquire(url, n=3)
+
+        bucket = limiter.buckets['example.com']
+        assert bucket.tokens == pytest.approx(2.0, abs=0.1)
+
+        with pytest.raises(ValueError):
+            limiter.acquire(url, n=6)
+
     def test_acquire_with_delay(self):
         """Test acquire adds delays when needed."""
         limiter = RateLimiter(requests_per_second=2.0)
@@ -186,14 +255,13 @@ class TestRateLimiter:
         url = 'https://example.com/page'
 
         # First request should be immediate
-        with limiter.acquire(url) as waited:
-            assert waited < 0.1
+        waited = limiter.acquire(url)
+        assert waited < 0.1
 
         # Exhaust tokens
         for _ in range(5):
             try:
-                with limiter.acquire(url, timeout=0.5):
-                    pass
+                limiter.acquire(url, timeout=0.5)
             except TimeoutError:
                 break
 
@@ -276,6 +344,35 @@ class TestRateLimiter:
         assert slow_bucket.rate == 0.5
         assert normal_bucket.rate == 5.0
 
+    def test_idle_domains_evicted(self):
+        """Test that least recently used domains are forgotten past max_domains."""
+        limiter = RateLimiter(requests_per_second=10.0, max_domains=2)
+        limiter.set_domain_limit('a.example.com', 0.5)
+
+        for host in ('a', 'b', 'c'):
+            limiter.acquire(f'https://{host}.example.com/')
+
+        assert 'a.example.com' not in limiter.buckets
+        assert set(limiter.buckets) == {'b.example.com', 'c.example.com'}
+
+        # Custom limits outlive eviction
+        limiter.acquire('https://a.example.com/')
+        assert limiter.buckets['a.example.com'].rate == 0.5
+
+    def test_single_domain_limiter(self):
+        """Test that a single-domain limiter charges every URL to one bucket."""
+        limiter = RateLimiter.for_single_domain(
+            'docs.example.com', requests_per_second=10.0, burst_size=5
+        )
+
+        limiter.acquire('https://docs.example.com/a')
+        limiter.acquire('https://docs.example.com/b')
+        limiter.record_response('https://docs.example.com/b', 200)
+
+        assert list(limiter.buckets) == ['docs.example.com']
+        assert limiter.buckets['docs.example.com'].tokens == pytest.approx(3.0, abs=0.1)
+        assert limiter.get_stats('docs.example.com')['requests'] == 1
+
     def test_get_stats_all_domains(self):
         """Test getting stats for all domains."""
         limiter = RateLimiter()
@@ -309,13 +406,11 @@ class TestRateLimiter:
         url = 'https://example.com/page'
 
         # Exhaust tokens
-        with limiter.acquire(url):
-            pass
+        limiter.acquire(url)
 
         # Next request should timeout
         with pytest.raises(TimeoutError):
-            with limiter.acquire(url, timeout=0.1):
-                pass
+            limiter.acquire(url, timeout=0.1)
 
     def test_concurrent_requests(self):
         """Test handling of concurrent requests."""
@@ -326,8 +421,8 @@ class TestRateLimiter:
 
         def make_request():
             try:
-                with limiter.acquire(url, timeout=1.0):
-                    results.append(True)
+                limiter.acquire(url, timeout=1.0)
+                results.append(True)
             except TimeoutError:
                 results.append(False)
 
@@ -429,9 +524,33 @@ class TestAdaptiveThrottling:
         limiter.record_response(url, 500)
 
         domain = 'example.com'
-        errors = limiter.recent_errors[domain]
+        error_count = limiter._err_count[domain]
+
+        assert error_count >= 2  # 429 and 503 are throttle errors
+
+    def test_retry_after_extends_backoff(self):
+        """Test that a server Retry-After delay is honored."""
+        limiter = RateLimiter()
+
+        limiter.record_response('https://example.com/page', 429, retry_after=30.0)
+
+        remaining = limiter._is_backed_off('example.com')
+        assert 29.0 < remaining <= 30.0
+
+    def test_parse_retry_after(self):
+        """Test parsing delay-seconds and HTTP-date Retry-After values."""
+        assert parse_retry_after('120') == 120.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('soon') is None
+
+        # A date in the past means "retry now"
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+    def test_parse_retry_after_minus_zero_zone(self, east_of_utc):
+        """Test a "-0000" Retry-After date is read as UTC, not local time."""
+        value = formatdate(time.time() + 60).replace('+0000', '-0000')
 
-        assert len(errors) >= 2  # 429 and 503 are throttle errors
+        assert 55.0 < parse_retry_after(value) <= 60.0
 
     def test_backoff_clearing(self):
         """Test that backoff clears after success."""